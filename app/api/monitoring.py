@@ -7,11 +7,11 @@ and monitoring data for the VidNet application.
 
 import time
 import logging
-import json
+import orjson
 from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
 
+from app.core.responses import ORJSONResponse
 from app.services.performance_monitor import performance_monitor
 from app.services.metrics_collector import metrics_collector
 from app.middleware.rate_limiter import rate_limiter
@@ -28,12 +28,12 @@ router = APIRouter(prefix="/api/v1/monitoring", tags=["monitoring"])
     summary="System health check",
     description="Get comprehensive system health status with performance metrics and alerts"
 )
-async def get_health_status() -> JSONResponse:
+async def get_health_status() -> ORJSONResponse:
     """
     Get comprehensive system health status.
     
     Returns:
-        JSONResponse with health status, alerts, and system metrics
+        ORJSONResponse with health status, alerts, and system metrics
     """
     try:
         start_time = time.time()
@@ -42,7 +42,7 @@ async def get_health_status() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200 if health_status['status'] == 'healthy' else 503,
             content={
                 "success": True,
@@ -54,7 +54,7 @@ async def get_health_status() -> JSONResponse:
     except Exception as e:
         logger.error(f"Health check error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -73,7 +73,7 @@ async def get_health_status() -> JSONResponse:
 async def get_performance_metrics(
     endpoint: Optional[str] = Query(None, description="Specific endpoint to get metrics for"),
     time_window: int = Query(60, description="Time window in minutes for metrics", ge=1, le=1440)
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get performance metrics.
     
@@ -82,7 +82,7 @@ async def get_performance_metrics(
         time_window: Time window in minutes (1-1440)
         
     Returns:
-        JSONResponse with performance metrics
+        ORJSONResponse with performance metrics
     """
     try:
         start_time = time.time()
@@ -98,7 +98,7 @@ async def get_performance_metrics(
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -115,7 +115,7 @@ async def get_performance_metrics(
     except Exception as e:
         logger.error(f"Performance metrics error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -131,12 +131,12 @@ async def get_performance_metrics(
     summary="Rate limiting statistics",
     description="Get current rate limiting statistics and configuration"
 )
-async def get_rate_limit_stats() -> JSONResponse:
+async def get_rate_limit_stats() -> ORJSONResponse:
     """
     Get rate limiting statistics.
     
     Returns:
-        JSONResponse with rate limiting metrics and configuration
+        ORJSONResponse with rate limiting metrics and configuration
     """
     try:
         start_time = time.time()
@@ -145,7 +145,7 @@ async def get_rate_limit_stats() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -157,7 +157,7 @@ async def get_rate_limit_stats() -> JSONResponse:
     except Exception as e:
         logger.error(f"Rate limit stats error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -173,12 +173,12 @@ async def get_rate_limit_stats() -> JSONResponse:
     summary="System resource metrics",
     description="Get current system resource usage (CPU, memory, disk, connections)"
 )
-async def get_system_metrics() -> JSONResponse:
+async def get_system_metrics() -> ORJSONResponse:
     """
     Get current system resource metrics.
     
     Returns:
-        JSONResponse with system resource usage
+        ORJSONResponse with system resource usage
     """
     try:
         start_time = time.time()
@@ -187,7 +187,7 @@ async def get_system_metrics() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -199,7 +199,7 @@ async def get_system_metrics() -> JSONResponse:
     except Exception as e:
         logger.error(f"System metrics error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -215,12 +215,12 @@ async def get_system_metrics() -> JSONResponse:
     summary="Endpoint performance statistics",
     description="Get performance statistics for all API endpoints"
 )
-async def get_endpoint_performance() -> JSONResponse:
+async def get_endpoint_performance() -> ORJSONResponse:
     """
     Get endpoint performance statistics.
     
     Returns:
-        JSONResponse with endpoint performance data
+        ORJSONResponse with endpoint performance data
     """
     try:
         start_time = time.time()
@@ -229,7 +229,7 @@ async def get_endpoint_performance() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -244,7 +244,7 @@ async def get_endpoint_performance() -> JSONResponse:
     except Exception as e:
         logger.error(f"Endpoint performance error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -260,12 +260,12 @@ async def get_endpoint_performance() -> JSONResponse:
     summary="Performance alerts",
     description="Get current performance alerts and thresholds"
 )
-async def get_performance_alerts() -> JSONResponse:
+async def get_performance_alerts() -> ORJSONResponse:
     """
     Get current performance alerts.
     
     Returns:
-        JSONResponse with performance alerts and thresholds
+        ORJSONResponse with performance alerts and thresholds
     """
     try:
         start_time = time.time()
@@ -276,7 +276,7 @@ async def get_performance_alerts() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -294,7 +294,7 @@ async def get_performance_alerts() -> JSONResponse:
     except Exception as e:
         logger.error(f"Performance alerts error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -312,7 +312,7 @@ async def get_performance_alerts() -> JSONResponse:
 )
 async def export_metrics(
     time_window_hours: int = Query(24, description="Time window in hours for metrics export", ge=1, le=168)
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Export performance metrics to file.
     
@@ -320,7 +320,7 @@ async def export_metrics(
         time_window_hours: Time window in hours (1-168)
     
     Returns:
-        JSONResponse with export status
+        ORJSONResponse with export status
     """
     try:
         start_time = time.time()
@@ -335,7 +335,7 @@ async def export_metrics(
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -352,7 +352,7 @@ async def export_metrics(
     except Exception as e:
         logger.error(f"Export metrics error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -368,12 +368,12 @@ async def export_metrics(
     summary="Monitoring dashboard data",
     description="Get comprehensive monitoring data for dashboard display"
 )
-async def get_dashboard_data() -> JSONResponse:
+async def get_dashboard_data() -> ORJSONResponse:
     """
     Get comprehensive monitoring data for dashboard.
     
     Returns:
-        JSONResponse with dashboard data
+        ORJSONResponse with dashboard data
     """
     try:
         start_time = time.time()
@@ -383,7 +383,7 @@ async def get_dashboard_data() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -395,7 +395,7 @@ async def get_dashboard_data() -> JSONResponse:
     except Exception as e:
         logger.error(f"Dashboard data error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -410,12 +410,12 @@ async def get_dashboard_data() -> JSONResponse:
     summary="Business metrics",
     description="Get business-specific metrics including downloads, platforms, and user engagement"
 )
-async def get_business_metrics() -> JSONResponse:
+async def get_business_metrics() -> ORJSONResponse:
     """
     Get business-specific metrics.
     
     Returns:
-        JSONResponse with business metrics
+        ORJSONResponse with business metrics
     """
     try:
         start_time = time.time()
@@ -431,7 +431,7 @@ async def get_business_metrics() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -453,7 +453,7 @@ async def get_business_metrics() -> JSONResponse:
     except Exception as e:
         logger.error(f"Business metrics error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -469,12 +469,12 @@ async def get_business_metrics() -> JSONResponse:
     summary="Cache performance metrics",
     description="Get detailed cache performance metrics and optimization alerts"
 )
-async def get_cache_metrics() -> JSONResponse:
+async def get_cache_metrics() -> ORJSONResponse:
     """
     Get cache performance metrics.
     
     Returns:
-        JSONResponse with cache metrics and alerts
+        ORJSONResponse with cache metrics and alerts
     """
     try:
         start_time = time.time()
@@ -483,7 +483,7 @@ async def get_cache_metrics() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -495,7 +495,7 @@ async def get_cache_metrics() -> JSONResponse:
     except Exception as e:
         logger.error(f"Cache metrics error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -511,12 +511,12 @@ async def get_cache_metrics() -> JSONResponse:
     summary="Performance optimization alerts",
     description="Get current performance alerts and optimization recommendations"
 )
-async def get_performance_optimization_alerts() -> JSONResponse:
+async def get_performance_optimization_alerts() -> ORJSONResponse:
     """
     Get performance alerts and optimization recommendations.
     
     Returns:
-        JSONResponse with performance alerts
+        ORJSONResponse with performance alerts
     """
     try:
         start_time = time.time()
@@ -529,7 +529,7 @@ async def get_performance_optimization_alerts() -> JSONResponse:
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -551,7 +551,7 @@ async def get_performance_optimization_alerts() -> JSONResponse:
     except Exception as e:
         logger.error(f"Performance alerts error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -573,7 +573,7 @@ async def track_metric_event(
     metric_type: str = Query(..., description="Metric type (counter, gauge, histogram, timer)"),
     tags: Optional[str] = Query(None, description="JSON string of tags"),
     metadata: Optional[str] = Query(None, description="JSON string of metadata")
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Track a custom metric event.
     
@@ -585,7 +585,7 @@ async def track_metric_event(
         metadata: Optional JSON string of metadata
     
     Returns:
-        JSONResponse with tracking status
+        ORJSONResponse with tracking status
     """
     try:
         start_time = time.time()
@@ -596,9 +596,9 @@ async def track_metric_event(
         
         if tags:
             try:
-                parsed_tags = json.loads(tags)
-            except json.JSONDecodeError:
-                return JSONResponse(
+                parsed_tags = orjson.loads(tags)
+            except orjson.JSONDecodeError:
+                return ORJSONResponse(
                     status_code=400,
                     content={
                         "success": False,
@@ -609,9 +609,9 @@ async def track_metric_event(
         
         if metadata:
             try:
-                parsed_metadata = json.loads(metadata)
-            except json.JSONDecodeError:
-                return JSONResponse(
+                parsed_metadata = orjson.loads(metadata)
+            except orjson.JSONDecodeError:
+                return ORJSONResponse(
                     status_code=400,
                     content={
                         "success": False,
@@ -621,11 +621,11 @@ async def track_metric_event(
                 )
         
         # Validate metric type
-        from app.services.metrics_collector import MetricType
+        from app.services.metrics_collector import MetricType, coerce_metric_type
         try:
-            metric_type_enum = MetricType(metric_type.lower())
+            metric_type_enum = coerce_metric_type(metric_type.lower())
         except ValueError:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "success": False,
@@ -645,7 +645,7 @@ async def track_metric_event(
         
         response_time = (time.time() - start_time) * 1000
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "success": True,
@@ -664,7 +664,7 @@ async def track_metric_event(
     except Exception as e:
         logger.error(f"Track metric event error: {e}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
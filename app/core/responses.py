@@ -0,0 +1,20 @@
+"""
+JSON response classes for VidNet MVP.
+
+This module provides an orjson-backed JSON response used by endpoints that
+return large metric payloads.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that serializes its content with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        # Metric breakdowns may be keyed by non-string values; stringify
+        # them the way the stdlib encoder does.
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
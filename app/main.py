@@ -18,6 +18,7 @@ from app.services.storage_manager import storage_manager
 from app.middleware.rate_limiter import rate_limiter, rate_limit_middleware, RateLimitConfig
 from app.middleware.error_handler import ErrorHandlingMiddleware
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -28,7 +29,8 @@ logging.basicConfig(
 app = FastAPI(
     title="VidNet API",
     description="High-performance video downloader API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Error handling middleware (should be first)
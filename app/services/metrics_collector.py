@@ -5,23 +5,45 @@ This module provides comprehensive metrics collection for business analytics,
 performance monitoring, and dashboard visualization.
 """
 
+import copy
 import time
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Union
+import threading
+from bisect import bisect_left
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from enum import Enum
-import json
 from pathlib import Path
 
+import orjson
+
 from app.services.cache_manager import cache_manager
 from app.services.performance_monitor import performance_monitor
 
 
 logger = logging.getLogger(__name__)
 
+# Metric timestamps only need millisecond-ish precision, so use the kernel's
+# coarse realtime clock where available (Linux) - it is read without touching
+# the hardware clock source and is noticeably cheaper than time.time().
+if hasattr(time, 'CLOCK_REALTIME_COARSE'):
+    _wall_clock = partial(time.clock_gettime, time.CLOCK_REALTIME_COARSE)
+else:
+    _wall_clock = time.time
+
+# Exported payloads may contain non-string keys (e.g. status codes)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Lookup tables for the cache tracking hot path (keyed by the hit flag)
+_BOOL_TAGS = {True: "True", False: "False"}
+_CACHE_GET_COUNTERS = {True: "cache_hits", False: "cache_misses"}
+
 
 class MetricType(Enum):
     """Metric type enumeration."""
@@ -31,7 +53,33 @@ class MetricType(Enum):
     TIMER = "timer"
 
 
-@dataclass
+# Direct value -> member table; MetricType("counter") goes through Enum's
+# generic lookup machinery, which is slower than a plain dict hit
+_METRIC_TYPES_BY_VALUE: Dict[str, MetricType] = {member.value: member for member in MetricType}
+
+
+def coerce_metric_type(metric_type: Union[MetricType, str]) -> MetricType:
+    """
+    Convert a metric type value to a MetricType member.
+    
+    Args:
+        metric_type: MetricType member or its string value (e.g. "counter")
+    
+    Returns:
+        The matching MetricType member
+    
+    Raises:
+        ValueError: If the value is not a known metric type
+    """
+    if isinstance(metric_type, MetricType):
+        return metric_type
+    try:
+        return _METRIC_TYPES_BY_VALUE[metric_type]
+    except (KeyError, TypeError):
+        raise ValueError(f"{metric_type!r} is not a valid MetricType") from None
+
+
+@dataclass(slots=True)
 class MetricEvent:
     """Individual metric event data structure."""
     timestamp: float
@@ -42,7 +90,7 @@ class MetricEvent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessMetrics:
     """Business-specific metrics data structure."""
     timestamp: float
@@ -56,6 +104,124 @@ class BusinessMetrics:
     user_retention_rate: float = 0.0
 
 
+# Platform names are assigned one bit each on first sight, so the set of
+# platforms a user has touched can be stored as a single int per session
+_PLATFORM_BITS: Dict[str, int] = {}
+_PLATFORM_NAMES: List[str] = []
+_platform_bits_lock = threading.Lock()
+
+
+def _platform_bit(platform: str) -> int:
+    """Return the bit assigned to a platform name, registering it if new."""
+    bit = _PLATFORM_BITS.get(platform)
+    if bit is None:
+        with _platform_bits_lock:
+            bit = _PLATFORM_BITS.get(platform)
+            if bit is None:
+                bit = 1 << len(_PLATFORM_NAMES)
+                _PLATFORM_NAMES.append(platform)
+                _PLATFORM_BITS[platform] = bit
+    return bit
+
+
+def _platform_mask(platforms: Iterable[str]) -> int:
+    """Encode platform names as a bitmask."""
+    mask = 0
+    for platform in platforms:
+        mask |= _platform_bit(platform)
+    return mask
+
+
+class PlatformSet(AbstractSet[str]):
+    """
+    Set-like view of the platforms recorded in a session's bitmask.
+    
+    Supports membership, iteration, len() and set comparisons, plus add()
+    which sets the platform's bit on the owning session.
+    """
+    __slots__ = ('_session',)
+    
+    def __init__(self, session: "UserSession"):
+        self._session = session
+    
+    def __contains__(self, platform: object) -> bool:
+        bit = _PLATFORM_BITS.get(platform) if isinstance(platform, str) else None
+        return bit is not None and bool(self._session.platform_mask & bit)
+    
+    def __iter__(self) -> Iterator[str]:
+        mask = self._session.platform_mask
+        for index, platform in enumerate(_PLATFORM_NAMES):
+            if mask >> index & 1:
+                yield platform
+    
+    def __len__(self) -> int:
+        return self._session.platform_mask.bit_count()
+    
+    def __repr__(self) -> str:
+        return f"PlatformSet({set(self)!r})"
+    
+    def add(self, platform: str):
+        self._session.platform_mask |= _platform_bit(platform)
+
+
+class _ItemAccessMixin:
+    """Dict-style item access for slotted metric records."""
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__ and not isinstance(getattr(type(self), key, None), property):
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
+@dataclass(slots=True)
+class UserSession(_ItemAccessMixin):
+    """
+    Per-user engagement state.
+    
+    Slotted to keep the per-user footprint small; item access is supported so
+    sessions can still be read and updated like the plain dicts used before.
+    Platforms used are stored as a bitmask and exposed as a PlatformSet.
+    """
+    first_visit: float
+    last_activity: float
+    downloads: int = 0
+    audio_extractions: int = 0
+    platform_mask: int = 0
+    
+    @property
+    def platforms_used(self) -> PlatformSet:
+        return PlatformSet(self)
+    
+    @platforms_used.setter
+    def platforms_used(self, platforms: Iterable[str]):
+        self.platform_mask = _platform_mask(platforms)
+
+
+@dataclass(slots=True)
+class PlatformStats(_ItemAccessMixin):
+    """Running per-platform counters (supports item access like UserSession)."""
+    downloads: int = 0
+    audio_extractions: int = 0
+    total_processing_time: float = 0.0
+    success_rate: float = 0.0
+    error_count: int = 0
+
+
+@dataclass(slots=True)
+class QualityStats(_ItemAccessMixin):
+    """Running per-quality counters (supports item access like UserSession)."""
+    downloads: int = 0
+    total_file_size: int = 0
+    average_processing_time: float = 0.0
+
+
 class MetricsCollector:
     """
     Comprehensive metrics collection system for VidNet MVP.
@@ -69,11 +235,26 @@ class MetricsCollector:
     - Alert generation based on thresholds
     """
     
-    def __init__(self, max_events_history: int = 50000):
+    def __init__(self, max_events_history: int = 50000, dashboard_cache_ttl: float = 1.0):
         self.max_events_history = max_events_history
         
+        # Dashboard data is polled far more often than it meaningfully
+        # changes, so the aggregated result is reused for a short TTL
+        self.dashboard_cache_ttl = dashboard_cache_ttl
+        self._dashboard_cache: Optional[Dict[str, Any]] = None
+        self._dashboard_cache_time = 0.0
+        
         # Metrics storage
         self.metric_events: deque = deque(maxlen=max_events_history)
+        
+        # Appends left before metric_events is back in timestamp order. An
+        # event older than its predecessor breaks the order until that
+        # predecessor is evicted; meanwhile exports cannot binary-search by time
+        self._appends_until_ordered = 0
+        
+        # With max_events_history=0 only the real-time aggregates are kept,
+        # so skip building MetricEvent objects altogether
+        self._record_event = self._append_event if max_events_history > 0 else self._skip_event
         self.business_metrics_history: deque = deque(maxlen=1000)
         
         # Real-time counters
@@ -86,29 +267,13 @@ class MetricsCollector:
         self.business_metrics = BusinessMetrics(timestamp=time.time())
         
         # Platform tracking
-        self.platform_stats = defaultdict(lambda: {
-            'downloads': 0,
-            'audio_extractions': 0,
-            'total_processing_time': 0.0,
-            'success_rate': 0.0,
-            'error_count': 0
-        })
+        self.platform_stats: Dict[str, PlatformStats] = defaultdict(PlatformStats)
         
         # Quality tracking
-        self.quality_stats = defaultdict(lambda: {
-            'downloads': 0,
-            'total_file_size': 0,
-            'average_processing_time': 0.0
-        })
+        self.quality_stats: Dict[str, QualityStats] = defaultdict(QualityStats)
         
         # User engagement tracking
-        self.user_sessions = defaultdict(lambda: {
-            'first_visit': time.time(),
-            'last_activity': time.time(),
-            'downloads': 0,
-            'audio_extractions': 0,
-            'platforms_used': set()
-        })
+        self.user_sessions = defaultdict(self._new_user_session)
         
         # Performance thresholds for alerts
         self.alert_thresholds = {
@@ -126,43 +291,77 @@ class MetricsCollector:
     
     def record_metric(self, name: str, value: Union[int, float], 
                      metric_type: MetricType, tags: Optional[Dict[str, str]] = None,
-                     metadata: Optional[Dict[str, Any]] = None):
+                     metadata: Optional[Dict[str, Any]] = None,
+                     timestamp: Optional[float] = None):
         """
         Record a custom metric event.
         
         Args:
             name: Metric name
             value: Metric value
-            metric_type: Type of metric (counter, gauge, histogram, timer)
+            metric_type: Type of metric (counter, gauge, histogram, timer),
+                either a MetricType member or its string value
             tags: Optional tags for filtering and grouping
             metadata: Optional additional metadata
+            timestamp: Optional event timestamp; callers recording several
+                metrics for one event pass a shared value to avoid re-reading
+                the clock
+        
+        Raises:
+            ValueError: If metric_type is not a known metric type
         """
-        event = MetricEvent(
-            timestamp=time.time(),
+        if metric_type.__class__ is not MetricType:
+            metric_type = coerce_metric_type(metric_type)
+        
+        self._record_event(name, value, metric_type, tags, metadata, timestamp)
+        
+        # Update real-time storage based on metric type. Enum members are
+        # singletons, so identity checks avoid Enum.__eq__ on the hot path.
+        if metric_type is MetricType.COUNTER:
+            self.counters[name] += value
+        elif metric_type is MetricType.GAUGE:
+            self.gauges[name] = value
+        elif metric_type is MetricType.HISTOGRAM:
+            self._append_bounded(self.histograms[name], value)
+        elif metric_type is MetricType.TIMER:
+            self._append_bounded(self.timers[name], value)
+    
+    def _append_event(self, name: str, value: Union[int, float], metric_type: MetricType,
+                      tags: Optional[Dict[str, str]], metadata: Optional[Dict[str, Any]],
+                      timestamp: Optional[float]):
+        """Append a metric event to the event history."""
+        if timestamp is None:
+            timestamp = _wall_clock()
+        
+        events = self.metric_events
+        if events and timestamp < events[-1].timestamp:
+            # The predecessor is evicted after maxlen - 1 further appends
+            self._appends_until_ordered = events.maxlen - 1
+        elif self._appends_until_ordered:
+            self._appends_until_ordered -= 1
+        
+        events.append(MetricEvent(
+            timestamp=timestamp,
             metric_name=name,
             metric_type=metric_type,
             value=value,
             tags=tags or {},
             metadata=metadata or {}
-        )
-        
-        self.metric_events.append(event)
-        
-        # Update real-time storage based on metric type
-        if metric_type == MetricType.COUNTER:
-            self.counters[name] += value
-        elif metric_type == MetricType.GAUGE:
-            self.gauges[name] = value
-        elif metric_type == MetricType.HISTOGRAM:
-            self.histograms[name].append(value)
-            # Keep only last 1000 values for memory efficiency
-            if len(self.histograms[name]) > 1000:
-                self.histograms[name] = self.histograms[name][-1000:]
-        elif metric_type == MetricType.TIMER:
-            self.timers[name].append(value)
-            # Keep only last 1000 values for memory efficiency
-            if len(self.timers[name]) > 1000:
-                self.timers[name] = self.timers[name][-1000:]
+        ))
+    
+    @staticmethod
+    def _skip_event(name: str, value: Union[int, float], metric_type: MetricType,
+                    tags: Optional[Dict[str, str]], metadata: Optional[Dict[str, Any]],
+                    timestamp: Optional[float]):
+        """Event sink used when no event history is retained."""
+    
+    @staticmethod
+    def _append_bounded(values: List[Union[int, float]], value: Union[int, float],
+                        limit: int = 1000):
+        """Append a sample, keeping only the last ``limit`` values in place."""
+        values.append(value)
+        if len(values) > limit:
+            del values[:-limit]
     
     def track_download(self, platform: str, quality: str, processing_time: float, 
                       success: bool, user_id: str, file_size: Optional[int] = None):
@@ -177,16 +376,66 @@ class MetricsCollector:
             user_id: User identifier
             file_size: Optional file size in bytes
         """
+        self._apply_download(platform, quality, processing_time, success, user_id,
+                             file_size, _wall_clock())
+        self.invalidate_dashboard_cache()
+    
+    def track_downloads_batch(self, platforms: Sequence[str], qualities: Sequence[str],
+                              processing_times: Sequence[float], successes: Sequence[bool],
+                              user_ids: Sequence[str],
+                              file_sizes: Optional[Sequence[Optional[int]]] = None):
+        """
+        Track several download events in one call.
+        
+        All events share one timestamp and the dashboard cache is invalidated
+        once, which makes this cheaper than calling track_download per event
+        when a caller has a burst of completed downloads to report.
+        
+        Args:
+            platforms: Platform name per download
+            qualities: Video quality per download
+            processing_times: Processing time per download
+            successes: Success flag per download
+            user_ids: User identifier per download
+            file_sizes: Optional file size in bytes per download
+        
+        Raises:
+            ValueError: If the sequences have different lengths
+        """
+        count = len(platforms)
+        if file_sizes is None:
+            file_sizes = [None] * count
+        
+        if any(len(seq) != count for seq in (qualities, processing_times, successes,
+                                              user_ids, file_sizes)):
+            raise ValueError("All download batch sequences must have the same length")
+        
+        if count == 0:
+            return
+        
+        now = _wall_clock()
+        apply_download = self._apply_download
+        for record in zip(platforms, qualities, processing_times, successes, user_ids,
+                          file_sizes):
+            apply_download(*record, now)
+        
+        self.invalidate_dashboard_cache()
+    
+    def _apply_download(self, platform: str, quality: str, processing_time: float,
+                        success: bool, user_id: str, file_size: Optional[int],
+                        now: float):
+        """Apply a single download event to all metric stores."""
         # Record individual metrics
         self.record_metric("downloads_total", 1, MetricType.COUNTER, 
-                          tags={"platform": platform, "quality": quality, "success": str(success)})
+                          tags={"platform": platform, "quality": quality, "success": str(success)},
+                          timestamp=now)
         
         self.record_metric("download_processing_time", processing_time, MetricType.TIMER,
-                          tags={"platform": platform, "quality": quality})
+                          tags={"platform": platform, "quality": quality}, timestamp=now)
         
         if file_size:
             self.record_metric("download_file_size", file_size, MetricType.HISTOGRAM,
-                              tags={"platform": platform, "quality": quality})
+                              tags={"platform": platform, "quality": quality}, timestamp=now)
         
         # Update business metrics (only for successful downloads)
         if success:
@@ -200,36 +449,30 @@ class MetricsCollector:
         platform_stat = self.platform_stats[platform]
         
         if success:
-            platform_stat['downloads'] += 1
-            platform_stat['total_processing_time'] += processing_time
-            # Calculate success rate
-            total_attempts = platform_stat['downloads'] + platform_stat['error_count']
-            platform_stat['success_rate'] = (platform_stat['downloads'] / total_attempts) * 100
+            platform_stat.downloads += 1
+            platform_stat.total_processing_time += processing_time
         else:
-            platform_stat['error_count'] += 1
-            # Calculate success rate (failed downloads don't count as downloads)
-            total_attempts = platform_stat['downloads'] + platform_stat['error_count']
-            if total_attempts > 0:
-                platform_stat['success_rate'] = (platform_stat['downloads'] / total_attempts) * 100
-            else:
-                platform_stat['success_rate'] = 0.0
+            # Failed downloads don't count as downloads
+            platform_stat.error_count += 1
+        
+        # At least one attempt was just recorded, so the total is non-zero
+        platform_stat.success_rate = (
+            platform_stat.downloads / (platform_stat.downloads + platform_stat.error_count)
+        ) * 100
         
         # Update quality stats (only for successful downloads)
         if success:
             quality_stat = self.quality_stats[quality]
-            quality_stat['downloads'] += 1
+            quality_stat.downloads += 1
             if file_size:
-                quality_stat['total_file_size'] += file_size
+                quality_stat.total_file_size += file_size
             
-            # Calculate average processing time
-            if platform_stat['downloads'] > 0:
-                quality_stat['average_processing_time'] = \
-                    platform_stat['total_processing_time'] / platform_stat['downloads']
-            else:
-                quality_stat['average_processing_time'] = 0.0
+            # Average processing time (platform downloads > 0 after a success)
+            quality_stat.average_processing_time = \
+                platform_stat.total_processing_time / platform_stat.downloads
         
         # Update user session
-        self._update_user_session(user_id, platform, 'download')
+        self._update_user_session(user_id, platform, 'download', now)
     
     def track_audio_extraction(self, platform: str, quality: str, processing_time: float,
                              success: bool, user_id: str, file_size: Optional[int] = None):
@@ -244,26 +487,29 @@ class MetricsCollector:
             user_id: User identifier
             file_size: Optional file size in bytes
         """
+        now = _wall_clock()
+        
         # Record individual metrics
         self.record_metric("audio_extractions_total", 1, MetricType.COUNTER,
-                          tags={"platform": platform, "quality": quality, "success": str(success)})
+                          tags={"platform": platform, "quality": quality, "success": str(success)},
+                          timestamp=now)
         
         self.record_metric("audio_extraction_time", processing_time, MetricType.TIMER,
-                          tags={"platform": platform, "quality": quality})
+                          tags={"platform": platform, "quality": quality}, timestamp=now)
         
         if file_size:
             self.record_metric("audio_file_size", file_size, MetricType.HISTOGRAM,
-                              tags={"platform": platform, "quality": quality})
+                              tags={"platform": platform, "quality": quality}, timestamp=now)
         
         # Update business metrics
         self.business_metrics.audio_extractions_total += 1
         
         # Update platform stats
-        platform_stat = self.platform_stats[platform]
-        platform_stat['audio_extractions'] += 1
+        self.platform_stats[platform].audio_extractions += 1
         
         # Update user session
-        self._update_user_session(user_id, platform, 'audio_extraction')
+        self._update_user_session(user_id, platform, 'audio_extraction', now)
+        self.invalidate_dashboard_cache()
     
     def track_cache_operation(self, operation: str, hit: bool, response_time: float):
         """
@@ -274,17 +520,17 @@ class MetricsCollector:
             hit: Whether operation was a cache hit
             response_time: Time taken for cache operation
         """
+        now = _wall_clock()
+        hit = bool(hit)
+        
         self.record_metric("cache_operations_total", 1, MetricType.COUNTER,
-                          tags={"operation": operation, "hit": str(hit)})
+                          tags={"operation": operation, "hit": _BOOL_TAGS[hit]}, timestamp=now)
         
         self.record_metric("cache_response_time", response_time, MetricType.TIMER,
-                          tags={"operation": operation})
+                          tags={"operation": operation}, timestamp=now)
         
         if operation == "get":
-            if hit:
-                self.record_metric("cache_hits", 1, MetricType.COUNTER)
-            else:
-                self.record_metric("cache_misses", 1, MetricType.COUNTER)
+            self.record_metric(_CACHE_GET_COUNTERS[hit], 1, MetricType.COUNTER, timestamp=now)
     
     def track_error(self, error_type: str, endpoint: str, platform: Optional[str] = None,
                    user_id: Optional[str] = None):
@@ -305,9 +551,18 @@ class MetricsCollector:
         
         # Update platform error count if applicable
         if platform:
-            self.platform_stats[platform]['error_count'] += 1
+            self.platform_stats[platform].error_count += 1
+        
+        self.invalidate_dashboard_cache()
     
-    def _update_user_session(self, user_id: str, platform: str, action: str):
+    @staticmethod
+    def _new_user_session() -> UserSession:
+        """Create session state for a user seen for the first time."""
+        now = _wall_clock()
+        return UserSession(first_visit=now, last_activity=now)
+    
+    def _update_user_session(self, user_id: str, platform: str, action: str,
+                             timestamp: Optional[float] = None):
         """
         Update user session tracking.
         
@@ -315,9 +570,17 @@ class MetricsCollector:
             user_id: User identifier
             platform: Platform used
             action: Action performed (download, audio_extraction)
+            timestamp: Optional activity timestamp (defaults to now)
         """
-        session = self.user_sessions[user_id]
-        session['last_activity'] = time.time()
+        now = timestamp if timestamp is not None else _wall_clock()
+        
+        # A new session starts at the event's own timestamp, so first_visit
+        # never trails last_activity
+        session = self.user_sessions.get(user_id)
+        if session is None:
+            session = self.user_sessions[user_id] = UserSession(first_visit=now, last_activity=now)
+        else:
+            session['last_activity'] = now
         session['platforms_used'].add(platform)
         
         if action == 'download':
@@ -388,18 +651,19 @@ class MetricsCollector:
         platform_data = {}
         
         for platform, stats in self.platform_stats.items():
-            total_operations = stats['downloads'] + stats['audio_extractions']
+            downloads = stats.downloads
+            total_operations = downloads + stats.audio_extractions
             avg_processing_time = 0
             
-            if stats['downloads'] > 0:
-                avg_processing_time = stats['total_processing_time'] / stats['downloads']
+            if downloads > 0:
+                avg_processing_time = stats.total_processing_time / downloads
             
             platform_data[platform] = {
-                'downloads': stats['downloads'],
-                'audio_extractions': stats['audio_extractions'],
+                'downloads': downloads,
+                'audio_extractions': stats.audio_extractions,
                 'total_operations': total_operations,
-                'success_rate': stats['success_rate'],
-                'error_count': stats['error_count'],
+                'success_rate': stats.success_rate,
+                'error_count': stats.error_count,
                 'average_processing_time': avg_processing_time,
                 'popularity_rank': 0  # Will be calculated below
             }
@@ -421,21 +685,24 @@ class MetricsCollector:
             Dict with quality metrics and usage patterns
         """
         quality_data = {}
+        total_downloads = 0
         
         for quality, stats in self.quality_stats.items():
+            downloads = stats.downloads
+            total_downloads += downloads
+            
             avg_file_size = 0
-            if stats['downloads'] > 0 and stats['total_file_size'] > 0:
-                avg_file_size = stats['total_file_size'] / stats['downloads']
+            if downloads > 0 and stats.total_file_size > 0:
+                avg_file_size = stats.total_file_size / downloads
             
             quality_data[quality] = {
-                'downloads': stats['downloads'],
+                'downloads': downloads,
                 'average_file_size_mb': avg_file_size / (1024 * 1024) if avg_file_size > 0 else 0,
-                'average_processing_time': stats['average_processing_time'],
+                'average_processing_time': stats.average_processing_time,
                 'usage_percentage': 0  # Will be calculated below
             }
         
         # Calculate usage percentages
-        total_downloads = sum(stats['downloads'] for stats in self.quality_stats.values())
         if total_downloads > 0:
             for quality in quality_data:
                 usage_count = quality_data[quality]['downloads']
@@ -451,30 +718,29 @@ class MetricsCollector:
             Dict with user engagement data
         """
         current_time = time.time()
+        active_cutoff = current_time - 86400  # 24 hours
         active_users = 0
         returning_users = 0
+        total_operations = 0
         total_sessions = len(self.user_sessions)
         
-        # Calculate active and returning users (last 24 hours)
-        for user_id, session in self.user_sessions.items():
-            time_since_last_activity = current_time - session['last_activity']
+        # Single pass over sessions for activity, retention and volume
+        for session in self.user_sessions.values():
+            operations = session['downloads'] + session['audio_extractions']
+            total_operations += operations
             
             # Active in last 24 hours
-            if time_since_last_activity < 86400:  # 24 hours
+            if session['last_activity'] > active_cutoff:
                 active_users += 1
             
             # Returning user (more than one total operation)
-            if session['downloads'] + session['audio_extractions'] > 1:
+            if operations > 1:
                 returning_users += 1
         
         # Calculate retention rate
         retention_rate = (returning_users / total_sessions * 100) if total_sessions > 0 else 0
         
         # Calculate average operations per user
-        total_operations = sum(
-            session['downloads'] + session['audio_extractions'] 
-            for session in self.user_sessions.values()
-        )
         avg_operations_per_user = total_operations / total_sessions if total_sessions > 0 else 0
         
         return {
@@ -487,58 +753,82 @@ class MetricsCollector:
             'timestamp': current_time
         }
     
-    def get_performance_alerts(self) -> List[Dict[str, Any]]:
+    def get_performance_alerts(self, cache_metrics: Optional[Dict[str, Any]] = None,
+                               platform_metrics: Optional[Dict[str, Any]] = None
+                               ) -> List[Dict[str, Any]]:
         """
         Generate performance alerts based on current metrics.
         
+        Args:
+            cache_metrics: Optional result of get_cache_metrics() to reuse
+            platform_metrics: Optional result of get_platform_metrics() to reuse
+        
         Returns:
             List of alert dictionaries
         """
         alerts = []
         
         # Cache hit rate alerts
-        cache_metrics = self.get_cache_metrics()
+        if cache_metrics is None:
+            cache_metrics = self.get_cache_metrics()
         alerts.extend(cache_metrics.get('alerts', []))
         
-        # Platform success rate alerts
-        platform_metrics = self.get_platform_metrics()
-        for platform, data in platform_metrics.items():
-            success_rate = data['success_rate']
-            
-            if success_rate < self.alert_thresholds['download_success_rate_critical']:
+        # Only success rate and average processing time are needed, so read
+        # them straight from the running stats unless the full platform
+        # metrics were already built by the caller
+        if platform_metrics is None:
+            platform_figures = (
+                (platform, stats.success_rate,
+                 stats.total_processing_time / stats.downloads if stats.downloads > 0 else 0)
+                for platform, stats in self.platform_stats.items()
+            )
+        else:
+            platform_figures = (
+                (platform, data['success_rate'], data['average_processing_time'])
+                for platform, data in platform_metrics.items()
+            )
+        
+        thresholds = self.alert_thresholds
+        success_critical = thresholds['download_success_rate_critical']
+        success_warning = thresholds['download_success_rate_warning']
+        time_critical = thresholds['average_processing_time_critical']
+        time_warning = thresholds['average_processing_time_warning']
+        
+        for platform, success_rate, avg_time in platform_figures:
+            # Platform success rate alerts
+            if success_rate < success_critical:
                 alerts.append({
                     'level': 'critical',
                     'type': 'platform_success_rate',
                     'platform': platform,
                     'message': f"{platform} success rate critical: {success_rate:.1f}%",
-                    'threshold': self.alert_thresholds['download_success_rate_critical']
+                    'threshold': success_critical
                 })
-            elif success_rate < self.alert_thresholds['download_success_rate_warning']:
+            elif success_rate < success_warning:
                 alerts.append({
                     'level': 'warning',
                     'type': 'platform_success_rate',
                     'platform': platform,
                     'message': f"{platform} success rate low: {success_rate:.1f}%",
-                    'threshold': self.alert_thresholds['download_success_rate_warning']
+                    'threshold': success_warning
                 })
             
             # Processing time alerts
-            avg_time = data['average_processing_time']
-            if avg_time > self.alert_thresholds['average_processing_time_critical']:
+            if avg_time > time_critical:
                 alerts.append({
                     'level': 'critical',
                     'type': 'processing_time',
                     'platform': platform,
                     'message': f"{platform} processing time critical: {avg_time:.2f}s",
-                    'threshold': self.alert_thresholds['average_processing_time_critical']
+                    'threshold': time_critical
                 })
-            elif avg_time > self.alert_thresholds['average_processing_time_warning']:
+            elif avg_time > time_warning:
                 alerts.append({
                     'level': 'warning',
                     'type': 'processing_time',
                     'platform': platform,
                     'message': f"{platform} processing time high: {avg_time:.2f}s",
-                    'threshold': self.alert_thresholds['average_processing_time_warning']
+                    'threshold': time_warning
                 })
         
         return alerts
@@ -547,9 +837,20 @@ class MetricsCollector:
         """
         Get comprehensive dashboard data for visualization.
         
+        Results are cached for ``dashboard_cache_ttl`` seconds, and every call
+        returns its own copy, so callers may modify it. Tracking a download,
+        audio extraction or error invalidates the cache. Metrics recorded
+        directly through ``record_metric`` or ``track_cache_operation`` do
+        not, and may show up to ``dashboard_cache_ttl`` seconds late.
+        
         Returns:
             Dict with all dashboard metrics and data
         """
+        now = time.monotonic()
+        if (self._dashboard_cache is not None
+                and now - self._dashboard_cache_time < self.dashboard_cache_ttl):
+            return copy.deepcopy(self._dashboard_cache)
+        
         # Get performance monitor data
         performance_summary = performance_monitor.get_performance_summary(60)
         system_metrics = performance_monitor.get_system_metrics()
@@ -560,7 +861,7 @@ class MetricsCollector:
         platform_metrics = self.get_platform_metrics()
         quality_metrics = self.get_quality_metrics()
         user_engagement = self.get_user_engagement_metrics()
-        alerts = self.get_performance_alerts()
+        alerts = self.get_performance_alerts(cache_metrics, platform_metrics)
         
         # Calculate key performance indicators
         total_downloads = self.business_metrics.downloads_total
@@ -604,41 +905,56 @@ class MetricsCollector:
             'timestamp': time.time()
         }
         
-        return dashboard_data
+        self._dashboard_cache = dashboard_data
+        self._dashboard_cache_time = now
+        
+        return copy.deepcopy(dashboard_data)
+    
+    def invalidate_dashboard_cache(self):
+        """Drop cached dashboard data so the next request is rebuilt."""
+        self._dashboard_cache = None
     
-    def export_metrics(self, filepath: str, time_window_hours: int = 24):
+    def export_metrics(self, filepath: str, time_window_hours: int = 24,
+                       export_format: str = "json"):
         """
-        Export metrics to JSON file.
+        Export metrics to a JSON or JSON Lines file.
+        
+        The ``json`` format writes a single document. The ``jsonl`` format
+        writes a header line holding everything except the events, followed by
+        one line per metric event, so large event histories are serialized
+        one record at a time instead of as a single payload.
         
         Args:
             filepath: Path to export file
             time_window_hours: Time window for metrics export
+            export_format: Output format, either "json" or "jsonl"
         """
+        if export_format not in ("json", "jsonl"):
+            raise ValueError(f"Unsupported export format: {export_format}")
+        
         try:
             cutoff_time = time.time() - (time_window_hours * 3600)
             
-            # Filter recent events
-            recent_events = [
-                {
-                    'timestamp': event.timestamp,
-                    'metric_name': event.metric_name,
-                    'metric_type': event.metric_type.value,
-                    'value': event.value,
-                    'tags': event.tags,
-                    'metadata': event.metadata
-                }
-                for event in self.metric_events 
-                if event.timestamp >= cutoff_time
-            ]
+            if not self._appends_until_ordered:
+                # Binary search for the first event inside the window instead
+                # of testing every event
+                first_recent = bisect_left(self.metric_events, cutoff_time,
+                                           key=attrgetter('timestamp'))
+                recent_events = list(islice(self.metric_events, first_recent, None))
+            else:
+                # Explicit or clock-stepped timestamps arrived out of order
+                recent_events = [
+                    event for event in self.metric_events if event.timestamp >= cutoff_time
+                ]
             
             export_data = {
                 'export_info': {
                     'timestamp': time.time(),
                     'time_window_hours': time_window_hours,
-                    'total_events': len(recent_events)
+                    'total_events': len(recent_events),
+                    'format': export_format
                 },
                 'dashboard_data': self.get_dashboard_data(),
-                'metric_events': recent_events,
                 'business_metrics': {
                     'downloads_total': self.business_metrics.downloads_total,
                     'audio_extractions_total': self.business_metrics.audio_extractions_total,
@@ -652,14 +968,38 @@ class MetricsCollector:
             # Ensure directory exists
             Path(filepath).parent.mkdir(parents=True, exist_ok=True)
             
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                if export_format == "jsonl":
+                    f.write(orjson.dumps(export_data, default=str, option=_ORJSON_OPTIONS))
+                    f.write(b"\n")
+                    for event in recent_events:
+                        f.write(orjson.dumps(self._event_to_dict(event), default=str,
+                                             option=_ORJSON_OPTIONS))
+                        f.write(b"\n")
+                else:
+                    export_data['metric_events'] = [
+                        self._event_to_dict(event) for event in recent_events
+                    ]
+                    f.write(orjson.dumps(export_data, default=str,
+                                         option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
             
             logger.info(f"Metrics exported to {filepath}")
             
         except Exception as e:
             logger.error(f"Failed to export metrics: {e}")
             raise
+    
+    @staticmethod
+    def _event_to_dict(event: MetricEvent) -> Dict[str, Any]:
+        """Convert a metric event to its exported representation."""
+        return {
+            'timestamp': event.timestamp,
+            'metric_name': event.metric_name,
+            'metric_type': event.metric_type.value,
+            'value': event.value,
+            'tags': event.tags,
+            'metadata': event.metadata
+        }
 
 
 # Global metrics collector instance
@@ -15,9 +15,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque, defaultdict
 from contextlib import asynccontextmanager
-import json
 from pathlib import Path
 
+import orjson
+
 from app.services.cache_manager import cache_manager
 
 
@@ -92,10 +93,23 @@ class PerformanceMonitor:
             'error_rate_critical': 15.0  # 15%
         }
         
+        # Walking every inet socket is expensive, so the connection count
+        # is refreshed at most once per TTL (seconds)
+        self.connections_ttl = 10.0
+        self._connections_count = 0
+        self._connections_checked_at: Optional[float] = None
+        
         # Monitoring state
         self._monitoring_active = False
         self._system_monitor_task: Optional[asyncio.Task] = None
         self._metrics_cleanup_task: Optional[asyncio.Task] = None
+        self._metrics_recorder_task: Optional[asyncio.Task] = None
+        
+        # Request metrics waiting for the recorder worker; only set while
+        # monitoring runs, otherwise requests are recorded inline
+        self._pending_metrics: Optional[asyncio.Queue] = None
+        self.pending_metrics_limit = 4096
+        self.recorder_batch_size = 256
         
         # Thread-safe lock for metrics updates
         self._lock = threading.Lock()
@@ -115,6 +129,10 @@ class PerformanceMonitor:
         # Start metrics cleanup task
         self._metrics_cleanup_task = asyncio.create_task(self._metrics_cleanup_worker())
         
+        # Start request metrics recorder task
+        self._pending_metrics = asyncio.Queue(maxsize=self.pending_metrics_limit)
+        self._metrics_recorder_task = asyncio.create_task(self._metrics_recorder_worker())
+        
         logger.info("Performance monitoring started")
     
     async def stop_monitoring(self):
@@ -131,43 +149,82 @@ class PerformanceMonitor:
         if self._metrics_cleanup_task:
             self._metrics_cleanup_task.cancel()
         
+        if self._metrics_recorder_task:
+            self._metrics_recorder_task.cancel()
+        
         # Wait for tasks to complete
         await asyncio.gather(
             self._system_monitor_task,
             self._metrics_cleanup_task,
+            self._metrics_recorder_task,
             return_exceptions=True
         )
         
+        # Record whatever the recorder had not picked up yet
+        self.flush()
+        self._pending_metrics = None
+        
         logger.info("Performance monitoring stopped")
     
     def record_request(self, metrics: PerformanceMetrics):
         """
         Record request performance metrics.
         
+        While monitoring runs the metrics are queued for the recorder worker,
+        keeping statistics updates off the request path; otherwise (or when
+        the queue is full) they are recorded immediately.
+        
         Args:
             metrics: Performance metrics for the request
         """
+        if self._pending_metrics is not None:
+            try:
+                self._pending_metrics.put_nowait(metrics)
+                return
+            except asyncio.QueueFull:
+                pass
+        
+        self._record_batch((metrics,))
+    
+    def flush(self):
+        """Record every queued request metric now."""
+        if self._pending_metrics is None:
+            return
+        
+        batch = []
+        while True:
+            try:
+                batch.append(self._pending_metrics.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        
+        if batch:
+            self._record_batch(batch)
+    
+    def _record_batch(self, batch: List[PerformanceMetrics]):
+        """Apply a batch of request metrics to the history and endpoint statistics."""
         with self._lock:
-            # Add to metrics history
-            self.request_metrics.append(metrics)
-            
-            # Update endpoint statistics
-            endpoint_key = f"{metrics.method} {metrics.endpoint}"
-            stats = self.endpoint_stats[endpoint_key]
-            
-            stats['total_requests'] += 1
-            stats['total_response_time'] += metrics.response_time
-            stats['min_response_time'] = min(stats['min_response_time'], metrics.response_time)
-            stats['max_response_time'] = max(stats['max_response_time'], metrics.response_time)
-            stats['last_request'] = metrics.timestamp
-            
-            if metrics.status_code >= 400:
-                stats['error_count'] += 1
-            else:
-                stats['success_count'] += 1
-            
-            # Check for performance alerts
-            self._check_performance_alerts(metrics)
+            for metrics in batch:
+                # Add to metrics history
+                self.request_metrics.append(metrics)
+                
+                # Update endpoint statistics
+                endpoint_key = f"{metrics.method} {metrics.endpoint}"
+                stats = self.endpoint_stats[endpoint_key]
+                
+                stats['total_requests'] += 1
+                stats['total_response_time'] += metrics.response_time
+                stats['min_response_time'] = min(stats['min_response_time'], metrics.response_time)
+                stats['max_response_time'] = max(stats['max_response_time'], metrics.response_time)
+                stats['last_request'] = metrics.timestamp
+                
+                if metrics.status_code >= 400:
+                    stats['error_count'] += 1
+                else:
+                    stats['success_count'] += 1
+                
+                # Check for performance alerts
+                self._check_performance_alerts(metrics)
     
     @asynccontextmanager
     async def track_request(self, endpoint: str, method: str, client_id: str, user_agent: str = ""):
@@ -216,6 +273,8 @@ class PerformanceMonitor:
         Returns:
             Dict with endpoint statistics
         """
+        self.flush()
+        
         with self._lock:
             if endpoint:
                 stats = self.endpoint_stats.get(endpoint, {})
@@ -257,10 +316,7 @@ class PerformanceMonitor:
             disk = psutil.disk_usage('/')
             
             # Get network connections (approximate active connections)
-            try:
-                connections = len(psutil.net_connections(kind='inet'))
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                connections = 0
+            connections = self._count_connections()
             
             # Get load average (Unix-like systems)
             try:
@@ -299,6 +355,17 @@ class PerformanceMonitor:
                 'timestamp': time.time()
             }
     
+    def _count_connections(self) -> int:
+        """Return the number of inet connections, re-counted at most once per TTL."""
+        now = time.monotonic()
+        if self._connections_checked_at is None or now - self._connections_checked_at >= self.connections_ttl:
+            try:
+                self._connections_count = len(psutil.net_connections(kind='inet'))
+            except (psutil.AccessDenied, psutil.NoSuchProcess):
+                self._connections_count = 0
+            self._connections_checked_at = now
+        return self._connections_count
+    
     def get_performance_summary(self, time_window_minutes: int = 60) -> Dict[str, Any]:
         """
         Get performance summary for the specified time window.
@@ -309,6 +376,7 @@ class PerformanceMonitor:
         Returns:
             Dict with performance summary
         """
+        self.flush()
         cutoff_time = time.time() - (time_window_minutes * 60)
         
         with self._lock:
@@ -498,6 +566,22 @@ class PerformanceMonitor:
                 logger.error(f"System monitor worker error: {e}")
                 await asyncio.sleep(60)
     
+    async def _metrics_recorder_worker(self):
+        """Background worker to record queued request metrics in batches."""
+        while self._monitoring_active:
+            try:
+                batch = [await self._pending_metrics.get()]
+                while len(batch) < self.recorder_batch_size:
+                    try:
+                        batch.append(self._pending_metrics.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                
+                self._record_batch(batch)
+                
+            except Exception as e:
+                logger.error(f"Metrics recorder worker error: {e}")
+    
     async def _metrics_cleanup_worker(self):
         """Background worker to clean up old metrics."""
         while self._monitoring_active:
@@ -538,8 +622,9 @@ class PerformanceMonitor:
                 'export_timestamp': time.time()
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(export_data, default=str,
+                                     option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2))
             
             logger.info(f"Metrics exported to {filepath}")
             
@@ -6,14 +6,42 @@ and validation for all supported video platforms.
 """
 
 import re
-from typing import Optional, Dict, List, Tuple
-from urllib.parse import urlparse, parse_qs, unquote
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Iterable, NamedTuple, Optional, Dict, List, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qs, unquote
 from dataclasses import dataclass
 
 
-@dataclass
+# Bound on the per-method URL caches
+_URL_CACHE_SIZE = 4096
+
+
+# Extensions recognised on direct video links
+_VIDEO_EXTENSIONS = frozenset((
+    '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.m4v',
+    '.3gp', '.wmv', '.ogv', '.mpg', '.mpeg', '.m2v', '.divx',
+    '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', '.rmvb', '.f4v'
+))
+
+# Direct links end in a known extension, optionally followed by a query.
+# Longest extensions come first so no alternative is shadowed by a shorter
+# prefix. No leading '.*': search already tries every start, and the
+# wildcard made misses quadratic in the URL length.
+_DIRECT_LINK_PATTERN = r'\.({})(\?.*)?$'.format('|'.join(
+    sorted((re.escape(ext[1:]) for ext in _VIDEO_EXTENSIONS), key=lambda ext: (-len(ext), ext))
+))
+
+# Tracking query parameters stripped before detection, besides any utm_*
+_TRACKING_PARAMS = frozenset(('fbclid', 'gclid', 'msclkid'))
+
+# Substrings present in any URL that carries a tracking parameter
+_TRACKING_MARKERS = ('utm_',) + tuple(sorted(f'{key}=' for key in _TRACKING_PARAMS))
+
+
+@dataclass(frozen=True, slots=True)
 class PlatformInfo:
-    """Information about a detected platform."""
+    """Information about a detected platform (immutable, without a __dict__)."""
     name: str
     video_id: Optional[str]
     normalized_url: str
@@ -21,6 +49,165 @@ class PlatformInfo:
     metadata: Dict[str, any]
 
 
+class _Validation(NamedTuple):
+    """Immutable, cacheable outcome of validating a URL string."""
+    is_valid: bool
+    platform: Optional[str] = None
+    video_id: Optional[str] = None
+    normalized_url: Optional[str] = None
+    metadata: Tuple[Tuple[str, any], ...] = ()
+    error: Optional[str] = None
+    warnings: Tuple[str, ...] = ()
+
+
+# Shared outcome for inputs that are not a non-empty string
+_NON_STRING_URL = _Validation(False, error='URL must be a non-empty string')
+
+
+def _strip_tracking_params(url: str) -> str:
+    """Drop utm_* and click-ID parameters from the URL's query string."""
+    if not any(marker in url for marker in _TRACKING_MARKERS):
+        return url
+    
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    
+    kept = [
+        param for param in parts.query.split('&')
+        if not _is_tracking_param(param.partition('=')[0])
+    ]
+    query = '&'.join(kept)
+    if query == parts.query:
+        return url
+    return urlunsplit(parts._replace(query=query))
+
+
+def _is_tracking_param(key: str) -> bool:
+    """Whether a query parameter name is a known tracking parameter."""
+    return key.startswith('utm_') or key in _TRACKING_PARAMS
+
+
+def _build_host_trie(platform_patterns: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Build a suffix trie over the platforms' domain aliases.
+    
+    Host labels are stored right to left ('www.youtube.com' walks
+    'com' -> 'youtube' -> 'www'), and a node that ends an alias records
+    the owning platform under the None key.
+    """
+    trie: Dict[str, Dict] = {}
+    for platform, config in platform_patterns.items():
+        for domain in config['domain_aliases']:
+            node = trie
+            for label in reversed(domain.lower().split('.')):
+                node = node.setdefault(label, {})
+            node[None] = platform
+    return trie
+
+
+def _build_host_map(platform_patterns: Dict[str, Dict]) -> Dict[str, str]:
+    """Map each domain alias, with and without a leading 'www.', to its platform."""
+    hosts: Dict[str, str] = {}
+    for platform, config in platform_patterns.items():
+        for domain in config['domain_aliases']:
+            domain = domain.lower()
+            hosts.setdefault(domain, platform)
+            hosts.setdefault(f'www.{domain}', platform)
+    return hosts
+
+
+def _build_prefix_map(host_map: Dict[str, str]) -> Dict[str, str]:
+    """Map the 'scheme://host/' prefix of every host in host_map to its platform."""
+    return {
+        f'{scheme}{host}/': platform
+        for host, platform in host_map.items()
+        for scheme in ('https://', 'http://')
+    }
+
+
+def _compile_templates(platform_patterns: Dict[str, Dict]) -> Dict[str, Tuple[str, str]]:
+    """
+    Split each platform's normalize template around its single {video_id}
+    field, so normalizing is a concatenation rather than a format call.
+    Templates using any other field are left for str.format.
+    """
+    templates: Dict[str, Tuple[str, str]] = {}
+    for platform, config in platform_patterns.items():
+        template = config['normalize_template']
+        if not template:
+            continue
+        fields = [field for _, field, _, _ in Formatter().parse(template) if field is not None]
+        if fields == ['video_id']:
+            prefix, _, suffix = template.partition('{video_id}')
+            templates[platform] = (prefix, suffix)
+    return templates
+
+
+def _compile_patterns(platform_patterns: Dict[str, Dict]) -> Dict[str, Tuple[re.Pattern, ...]]:
+    """
+    Compile every platform's URL patterns once, case-insensitively.
+    
+    The stdlib engine is sufficient here: no pattern contains an unbounded
+    wildcard ahead of other terms, so matching stays linear in the URL
+    length (see test_long_unmatched_url_is_linear).
+    """
+    return {
+        platform: tuple(re.compile(pattern, re.IGNORECASE) for pattern in config['patterns'])
+        for platform, config in platform_patterns.items()
+    }
+
+
+def _compile_union(platform_patterns: Dict[str, Dict]) -> re.Pattern:
+    """
+    Fuse every platform's patterns into one alternation with a named group
+    per platform, so a single search reports the platform in lastgroup.
+    """
+    return re.compile(
+        '|'.join(
+            f"(?P<{platform}>{'|'.join(config['patterns'])})"
+            for platform, config in platform_patterns.items()
+        ),
+        re.IGNORECASE,
+    )
+
+
+def _compile_prefilter(platform_patterns: Dict[str, Dict], extensions: Iterable[str]) -> re.Pattern:
+    """
+    Compile a cheap check that every URL some platform pattern can match
+    passes: each pattern spells out one of its platform's domain aliases,
+    and direct links end in a known extension before any query string.
+    """
+    aliases = {
+        domain.lower()
+        for config in platform_patterns.values()
+        for domain in config['domain_aliases']
+    }
+    # An alias that contains a shorter one adds nothing but alternation cost
+    domains = sorted(
+        re.escape(domain) for domain in aliases
+        if not any(other != domain and other in domain for other in aliases)
+    )
+    exts = sorted(re.escape(ext[1:]) for ext in extensions)
+    return re.compile(
+        f"{'|'.join(domains)}|\\.(?:{'|'.join(exts)})(?:\\?|$)",
+        re.IGNORECASE,
+    )
+
+
+def _lookup_host(trie: Dict[str, Dict], host: str) -> Optional[str]:
+    """Return the platform owning the longest alias that is a suffix of host."""
+    platform = None
+    node = trie
+    for label in reversed(host.split('.')):
+        node = node.get(label)
+        if node is None:
+            break
+        platform = node.get(None, platform)
+    return platform
+
+
 class PlatformDetector:
     """Advanced platform detection and URL processing service."""
     
@@ -132,16 +319,50 @@ class PlatformDetector:
         },
         'direct': {
             'patterns': [
-                # Direct video file links with various extensions
-                r'.*\.(mp4|avi|mov|mkv|webm|flv|m4v|3gp|wmv|ogv|mpg|mpeg|m2v|divx)(\?.*)?$',
-                # Additional video formats
-                r'.*\.(ts|mts|m2ts|vob|asf|rm|rmvb|f4v)(\?.*)?$',
+                # Direct video file links with any known extension
+                _DIRECT_LINK_PATTERN,
             ],
             'domain_aliases': [],
             'normalize_template': None  # Direct links are kept as-is
         }
     }
     
+    # Platform names and domains frozen at import for the lookup helpers.
+    # The names are identifier-like literals, which CPython already interns,
+    # and detection returns these same key objects, so comparing a detected
+    # platform with == short-circuits on identity without sys.intern.
+    _SUPPORTED_PLATFORMS: Tuple[str, ...] = tuple(PLATFORM_PATTERNS)
+    _SUPPORTED_PLATFORM_SET = frozenset(_SUPPORTED_PLATFORMS)
+    _PLATFORM_DOMAINS = {
+        platform: tuple(config['domain_aliases'])
+        for platform, config in PLATFORM_PATTERNS.items()
+    }
+    
+    # Normalize templates pre-split around the video ID
+    _NORMALIZE_TEMPLATES = _compile_templates(PLATFORM_PATTERNS)
+    
+    # Patterns compiled at import so no call pays the regex compile cost
+    _COMPILED_PATTERNS = _compile_patterns(PLATFORM_PATTERNS)
+    
+    # One alternation per platform, used once the host has named the platform
+    _PLATFORM_UNIONS = {
+        platform: _compile_union({platform: config})
+        for platform, config in PLATFORM_PATTERNS.items()
+    }
+    
+    # Rejects URLs that no pattern can match before scanning them all
+    _ANY_KNOWN = _compile_prefilter(PLATFORM_PATTERNS, _VIDEO_EXTENSIONS)
+    
+    # Domain alias trie used to pick the likely platform from the host alone
+    _HOST_TRIE = _build_host_trie(PLATFORM_PATTERNS)
+    
+    # Exact hosts of the domain aliases, checked before walking the trie
+    _HOST_PLATFORMS = _build_host_map(PLATFORM_PATTERNS)
+    
+    # Exact 'scheme://host/' prefixes of the common URL shapes, checked
+    # before parsing the URL at all
+    _URL_PREFIXES = _build_prefix_map(_HOST_PLATFORMS)
+    
     @classmethod
     def detect_platform(cls, url: str) -> Optional[str]:
         """
@@ -155,21 +376,55 @@ class PlatformDetector:
         """
         if not url or not isinstance(url, str):
             return None
-            
+        return cls._detect_platform_cached(url)
+    
+    @classmethod
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
+    def _detect_platform_cached(cls, url: str) -> Optional[str]:
+        """Detect the platform of a non-empty URL string, memoized per URL."""
+        # Kept in pure Python on purpose: the service deploys from
+        # requirements.txt with no compile step, and after the host fast
+        # path a miss costs one regex search against a handful of patterns.
         url = url.strip()
         if not url:
             return None
         
         # Normalize URL for detection
-        normalized_url = cls._preprocess_url(url)
+        return cls._detect_preprocessed(cls._preprocess_url(url))
+    
+    @classmethod
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
+    def _detect_preprocessed(cls, url: str) -> Optional[str]:
+        """Detect the platform of an already preprocessed URL, memoized per URL."""
+        # Fast path: try only the patterns of the platform that owns the host
+        platform = cls._platform_for_host(url)
+        if platform and cls._PLATFORM_UNIONS[platform].search(url):
+            return platform
         
-        for platform, config in cls.PLATFORM_PATTERNS.items():
-            for pattern in config['patterns']:
-                if re.search(pattern, normalized_url, re.IGNORECASE):
+        if not cls._ANY_KNOWN.search(url):
+            return None
+        
+        for platform, patterns in cls._COMPILED_PATTERNS.items():
+            for pattern in patterns:
+                if pattern.search(url):
                     return platform
         
         return None
     
+    @classmethod
+    def detect_platforms(cls, urls: Iterable[str]) -> List[Optional[str]]:
+        """
+        Detect the platforms of many URLs at once.
+        
+        Args:
+            urls: The video URLs to analyze
+            
+        Returns:
+            Platform name or None for each URL, in input order
+        """
+        detect = cls.detect_platform
+        return [detect(url) for url in urls]
+    
     @classmethod
     def extract_platform_info(cls, url: str) -> Optional[PlatformInfo]:
         """
@@ -191,8 +446,9 @@ class PlatformDetector:
         # Preprocess URL
         processed_url = cls._preprocess_url(original_url)
         
-        # Detect platform
-        platform = cls.detect_platform(processed_url)
+        # Detect platform on the preprocessed URL directly; going through
+        # detect_platform would strip, clean and decode it a second time
+        platform = cls._detect_preprocessed(processed_url)
         if not platform:
             return None
         
@@ -221,58 +477,61 @@ class PlatformDetector:
         Returns:
             Dictionary containing validation results and platform info
         """
-        result = {
-            'is_valid': False,
-            'platform': None,
-            'video_id': None,
-            'normalized_url': None,
-            'original_url': url,
-            'metadata': {},
-            'error': None,
-            'warnings': []
-        }
-        
         if not url or not isinstance(url, str):
-            result['error'] = 'URL must be a non-empty string'
-            return result
+            validation = _NON_STRING_URL
+        else:
+            validation = cls._validate_url_cached(url)
         
+        # The outcome is shared and immutable; build the result with fresh
+        # containers so callers can modify it freely
+        return {
+            'is_valid': validation.is_valid,
+            'platform': validation.platform,
+            'video_id': validation.video_id,
+            'normalized_url': validation.normalized_url,
+            'original_url': url,
+            'metadata': dict(validation.metadata),
+            'error': validation.error,
+            'warnings': list(validation.warnings)
+        }
+    
+    @classmethod
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
+    def _validate_url_cached(cls, url: str) -> _Validation:
+        """Validate a non-empty URL string, memoized per URL."""
         url = url.strip()
         if not url:
-            result['error'] = 'URL cannot be empty'
-            return result
+            return _Validation(False, error='URL cannot be empty')
+        
+        warnings = ()
         
         # Basic URL format validation
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             if not parsed.scheme:
                 url = f'https://{url}'
-                parsed = urlparse(url)
-                result['warnings'].append('Added https:// scheme to URL')
+                parsed = urlsplit(url)
+                warnings = ('Added https:// scheme to URL',)
             
             if not parsed.netloc:
-                result['error'] = 'Invalid URL format: missing domain'
-                return result
+                return _Validation(False, error='Invalid URL format: missing domain', warnings=warnings)
                 
         except Exception as e:
-            result['error'] = f'Invalid URL format: {str(e)}'
-            return result
+            return _Validation(False, error=f'Invalid URL format: {str(e)}', warnings=warnings)
         
         # Extract platform information
         platform_info = cls.extract_platform_info(url)
         if not platform_info:
-            result['error'] = 'Unsupported platform or invalid URL format'
-            return result
-        
-        # Update result with platform information
-        result.update({
-            'is_valid': True,
-            'platform': platform_info.name,
-            'video_id': platform_info.video_id,
-            'normalized_url': platform_info.normalized_url,
-            'metadata': platform_info.metadata
-        })
+            return _Validation(False, error='Unsupported platform or invalid URL format', warnings=warnings)
         
-        return result
+        return _Validation(
+            True,
+            platform=platform_info.name,
+            video_id=platform_info.video_id,
+            normalized_url=platform_info.normalized_url,
+            metadata=tuple(platform_info.metadata.items()),
+            warnings=warnings
+        )
     
     @classmethod
     def normalize_url(cls, url: str) -> Optional[str]:
@@ -285,24 +544,40 @@ class PlatformDetector:
         Returns:
             Normalized URL if successful, None otherwise
         """
+        if not url or not isinstance(url, str):
+            return None
+        return cls._normalize_url_cached(url)
+    
+    @classmethod
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
+    def _normalize_url_cached(cls, url: str) -> Optional[str]:
+        """Normalize a non-empty URL string, memoized per URL."""
         platform_info = cls.extract_platform_info(url)
         return platform_info.normalized_url if platform_info else None
     
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop all memoized URL results."""
+        cls._detect_platform_cached.cache_clear()
+        cls._detect_preprocessed.cache_clear()
+        cls._validate_url_cached.cache_clear()
+        cls._normalize_url_cached.cache_clear()
+        cls._preprocess_url.cache_clear()
+    
     @classmethod
     def get_supported_platforms(cls) -> List[str]:
         """Get list of all supported platforms."""
-        return list(cls.PLATFORM_PATTERNS.keys())
+        return list(cls._SUPPORTED_PLATFORMS)
     
     @classmethod
     def is_platform_supported(cls, platform: str) -> bool:
         """Check if a platform is supported."""
-        return platform.lower() in cls.PLATFORM_PATTERNS
+        return platform.lower() in cls._SUPPORTED_PLATFORM_SET
     
     @classmethod
     def get_platform_domains(cls, platform: str) -> List[str]:
         """Get list of domains for a specific platform."""
-        config = cls.PLATFORM_PATTERNS.get(platform.lower(), {})
-        return config.get('domain_aliases', [])
+        return list(cls._PLATFORM_DOMAINS.get(platform.lower(), ()))
     
     @classmethod
     def is_direct_video_link(cls, url: str) -> bool:
@@ -332,29 +607,42 @@ class PlatformDetector:
             return None
         
         # Extract extension from URL
-        parsed = urlparse(url)
-        path = parsed.path.lower()
-        
-        # Common video extensions
-        video_extensions = [
-            '.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.m4v', 
-            '.3gp', '.wmv', '.ogv', '.mpg', '.mpeg', '.m2v', '.divx',
-            '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', '.rmvb', '.f4v'
-        ]
+        path = urlsplit(url).path
+        dot = path.rfind('.')
+        if dot == -1:
+            return None
         
-        for ext in video_extensions:
-            if path.endswith(ext):
-                return ext
+        ext = path[dot:].lower()
+        return ext if ext in _VIDEO_EXTENSIONS else None
+    
+    @classmethod
+    def _platform_for_host(cls, url: str) -> Optional[str]:
+        """Look up the platform owning the URL's host, if it is a known alias."""
+        # An exact prefix hit pins down the host without parsing the URL
+        slash = url.find('/', url.find('//') + 2)
+        if slash != -1:
+            platform = cls._URL_PREFIXES.get(url[:slash + 1])
+            if platform:
+                return platform
         
-        return None
+        try:
+            host = urlsplit(url).hostname
+        except ValueError:
+            return None
+        if not host:
+            return None
+        return cls._HOST_PLATFORMS.get(host) or _lookup_host(cls._HOST_TRIE, host)
     
     @classmethod
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
     def _preprocess_url(cls, url: str) -> str:
         """Preprocess URL for consistent detection."""
+        # Clean URLs already take the cheap path through every step: the
+        # tracking strip and unquote return early on a substring check, so
+        # a separate up-front guard measured no faster
+        
         # Remove common tracking parameters
-        url = re.sub(r'[?&]utm_[^&]*', '', url)
-        url = re.sub(r'[?&]fbclid=[^&]*', '', url)
-        url = re.sub(r'[?&]gclid=[^&]*', '', url)
+        url = _strip_tracking_params(url)
         
         # Decode URL if needed
         url = unquote(url)
@@ -368,12 +656,11 @@ class PlatformDetector:
     @classmethod
     def _extract_video_info(cls, url: str, platform: str) -> Tuple[Optional[str], Dict[str, any]]:
         """Extract video ID and metadata from URL."""
-        config = cls.PLATFORM_PATTERNS.get(platform, {})
-        patterns = config.get('patterns', [])
+        patterns = cls._COMPILED_PATTERNS.get(platform, ())
         metadata = {}
         
         for pattern in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
+            match = pattern.search(url)
             if match:
                 groups = match.groups()
                 
@@ -386,7 +673,7 @@ class PlatformDetector:
                     # Reddit has subreddit and post ID
                     metadata['subreddit'] = groups[0]
                     return groups[1], metadata
-                elif platform == 'tiktok' and 'video' in pattern:
+                elif platform == 'tiktok' and 'video' in pattern.pattern:
                     # TikTok video pattern has username and video ID
                     if len(groups) >= 2:
                         metadata['username'] = groups[0]
@@ -402,10 +689,17 @@ class PlatformDetector:
     @classmethod
     def _normalize_url(cls, url: str, platform: str, video_id: Optional[str], metadata: Dict[str, any]) -> str:
         """Generate normalized URL for the platform."""
+        if not video_id:
+            return url
+        
+        split_template = cls._NORMALIZE_TEMPLATES.get(platform)
+        if split_template:
+            prefix, suffix = split_template
+            return f'{prefix}{video_id}{suffix}'
+        
         config = cls.PLATFORM_PATTERNS.get(platform, {})
         template = config.get('normalize_template')
-        
-        if not template or not video_id:
+        if not template:
             return url
         
         try:
@@ -420,6 +714,11 @@ def detect_platform(url: str) -> Optional[str]:
     return PlatformDetector.detect_platform(url)
 
 
+def detect_platforms(urls: Iterable[str]) -> List[Optional[str]]:
+    """Detect platforms for many URLs."""
+    return PlatformDetector.detect_platforms(urls)
+
+
 def validate_video_url(url: str) -> Dict[str, any]:
     """Validate video URL."""
     return PlatformDetector.validate_url(url)
@@ -446,36 +745,20 @@ def get_video_extension(url: str) -> Optional[str]:
 
 
 # Platform-specific validation functions
-def validate_youtube_url(url: str) -> bool:
-    """Validate YouTube URL format."""
-    return PlatformDetector.detect_platform(url) == 'youtube'
-
-
-def validate_tiktok_url(url: str) -> bool:
-    """Validate TikTok URL format."""
-    return PlatformDetector.detect_platform(url) == 'tiktok'
-
-
-def validate_instagram_url(url: str) -> bool:
-    """Validate Instagram URL format."""
-    return PlatformDetector.detect_platform(url) == 'instagram'
-
-
-def validate_facebook_url(url: str) -> bool:
-    """Validate Facebook URL format."""
-    return PlatformDetector.detect_platform(url) == 'facebook'
-
-
-def validate_twitter_url(url: str) -> bool:
-    """Validate Twitter/X URL format."""
-    return PlatformDetector.detect_platform(url) == 'twitter'
-
-
-def validate_reddit_url(url: str) -> bool:
-    """Validate Reddit URL format."""
-    return PlatformDetector.detect_platform(url) == 'reddit'
-
-
-def validate_vimeo_url(url: str) -> bool:
-    """Validate Vimeo URL format."""
-    return PlatformDetector.detect_platform(url) == 'vimeo'
\ No newline at end of file
+def _make_platform_validator(platform: str, display_name: str) -> Callable[[str], bool]:
+    """Build a validator that checks whether a URL belongs to one platform."""
+    def validator(url: str) -> bool:
+        return PlatformDetector.detect_platform(url) == platform
+    
+    validator.__name__ = validator.__qualname__ = f'validate_{platform}_url'
+    validator.__doc__ = f'Validate {display_name} URL format.'
+    return validator
+
+
+validate_youtube_url = _make_platform_validator('youtube', 'YouTube')
+validate_tiktok_url = _make_platform_validator('tiktok', 'TikTok')
+validate_instagram_url = _make_platform_validator('instagram', 'Instagram')
+validate_facebook_url = _make_platform_validator('facebook', 'Facebook')
+validate_twitter_url = _make_platform_validator('twitter', 'Twitter/X')
+validate_reddit_url = _make_platform_validator('reddit', 'Reddit')
+validate_vimeo_url = _make_platform_validator('vimeo', 'Vimeo')
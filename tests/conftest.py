@@ -12,7 +12,6 @@ from unittest.mock import Mock, AsyncMock, patch
 
 # Import app components for testing
 try:
-    from app.main import app
     from app.services.platform_detector import PlatformDetector
     from app.services.video_processor import VideoProcessor
     from app.services.download_manager import download_manager
@@ -21,7 +20,6 @@ try:
     from app.services.metrics_collector import metrics_collector
 except ImportError:
     # Handle case where app modules are not available
-    app = None
     PlatformDetector = None
     VideoProcessor = None
     download_manager = None
@@ -38,6 +36,13 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application, imported on first use instead of at collection."""
+    from app.main import app as fastapi_app
+    return fastapi_app
+
+
 @pytest.fixture
 def temp_directory():
     """Create a temporary directory for test files."""
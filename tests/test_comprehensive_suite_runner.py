@@ -20,13 +20,17 @@ import pytest
 # Import test modules
 from tests.test_complete_download_workflows import TestCompleteDownloadWorkflows
 from tests.test_load_performance import test_concurrent_user_load, test_rate_limiting_effectiveness
-from tests.test_platform_compatibility_integration import TestPlatformCompatibility
 from tests.test_scalability_load_testing import ScalabilityTestSuite, run_custom_load_test
 from tests.test_uptime_monitoring import run_uptime_monitoring
 
 
 logger = logging.getLogger(__name__)
 
+# The platform tests depend on fixtures defined next to them, so they are run
+# through pytest in a child process rather than called directly
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PLATFORM_COMPATIBILITY_TESTS = Path(__file__).with_name("test_platform_compatibility_integration.py")
+
 
 @dataclass
 class TestSuiteConfig:
@@ -397,34 +401,42 @@ class ComprehensiveTestRunner:
             raise Exception(f"Rate limiting test failed: {e}")
     
     # Platform test implementations
+    async def _run_platform_compatibility_tests(self, keyword: str):
+        """Run the platform compatibility tests matching a -k expression."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "pytest", "-q", str(PLATFORM_COMPATIBILITY_TESTS), "-k", keyword,
+            cwd=PROJECT_ROOT,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        output, _ = await process.communicate()
+        if process.returncode != 0:
+            summary = output.decode(errors="replace").strip().splitlines()[-1:]
+            raise Exception(f"Platform tests '{keyword}' failed: {' '.join(summary)}")
+    
     async def _test_platform_detection(self) -> Dict[str, Any]:
         """Test platform detection accuracy."""
-        test_suite = TestPlatformCompatibility()
-        await test_suite.test_platform_detection_accuracy(test_suite.platform_detector)
+        await self._run_platform_compatibility_tests("detect_single or platform_detection_accuracy")
         return {"test": "platform_detection", "status": "passed"}
     
     async def _test_url_validation(self) -> Dict[str, Any]:
         """Test URL validation."""
-        test_suite = TestPlatformCompatibility()
-        await test_suite.test_url_validation_comprehensive(test_suite.platform_detector)
+        await self._run_platform_compatibility_tests("url_validation_comprehensive")
         return {"test": "url_validation", "status": "passed"}
     
     async def _test_url_normalization(self) -> Dict[str, Any]:
         """Test URL normalization."""
-        test_suite = TestPlatformCompatibility()
-        await test_suite.test_url_normalization_consistency(test_suite.platform_detector)
+        await self._run_platform_compatibility_tests("url_normalization_consistency")
         return {"test": "url_normalization", "status": "passed"}
     
     async def _test_metadata_extraction(self) -> Dict[str, Any]:
         """Test metadata extraction."""
-        test_suite = TestPlatformCompatibility()
-        await test_suite.test_metadata_extraction_simulation(test_suite.video_processor)
+        await self._run_platform_compatibility_tests("metadata_extraction_simulation")
         return {"test": "metadata_extraction", "status": "passed"}
     
     async def _test_error_handling_robustness(self) -> Dict[str, Any]:
         """Test error handling robustness."""
-        test_suite = TestPlatformCompatibility()
-        await test_suite.test_error_handling_robustness(test_suite.platform_detector, test_suite.video_processor)
+        await self._run_platform_compatibility_tests("never_crashes or error_handling_robustness")
         return {"test": "error_handling_robustness", "status": "passed"}
     
     # Load test implementations
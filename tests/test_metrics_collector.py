@@ -12,7 +12,8 @@ from unittest.mock import Mock, patch, MagicMock
 from collections import defaultdict
 
 from app.services.metrics_collector import (
-    MetricsCollector, MetricType, MetricEvent, BusinessMetrics
+    MetricsCollector, MetricType, MetricEvent, BusinessMetrics, UserSession,
+    PlatformStats, QualityStats, coerce_metric_type
 )
 
 
@@ -62,6 +63,29 @@ class TestMetricsCollector:
         metrics_collector.record_metric("test_counter", 3, MetricType.COUNTER)
         assert metrics_collector.counters["test_counter"] == 8
     
+    def test_record_metric_without_event_history(self):
+        """Test max_events_history=0 keeps aggregates but no events."""
+        collector = MetricsCollector(max_events_history=0)
+        
+        collector.record_metric("test_counter", 2, MetricType.COUNTER)
+        collector.record_metric("test_timer", 0.5, MetricType.TIMER)
+        collector.track_download("youtube", "720p", 1.0, True, "user1")
+        
+        assert len(collector.metric_events) == 0
+        assert collector.counters["test_counter"] == 2
+        assert collector.timers["test_timer"] == [0.5]
+        assert collector.counters["downloads_total"] == 1
+    
+    def test_record_metric_string_type(self, metrics_collector):
+        """Test metric types can be given by their string value."""
+        metrics_collector.record_metric("test_counter", 1, "counter")
+        
+        assert metrics_collector.counters["test_counter"] == 1
+        assert metrics_collector.metric_events[0].metric_type is MetricType.COUNTER
+        
+        with pytest.raises(ValueError):
+            metrics_collector.record_metric("test_counter", 1, "invalid_type")
+    
     def test_record_metric_gauge(self, metrics_collector):
         """Test recording gauge metrics."""
         metrics_collector.record_metric("cpu_usage", 75.5, MetricType.GAUGE)
@@ -144,6 +168,36 @@ class TestMetricsCollector:
         assert platform_stat["error_count"] == 1
         assert platform_stat["success_rate"] == 0.0
     
+    def test_track_downloads_batch(self, metrics_collector):
+        """Test tracking a batch of download events."""
+        metrics_collector.track_downloads_batch(
+            platforms=["youtube", "youtube", "tiktok"],
+            qualities=["1080p", "720p", "720p"],
+            processing_times=[2.0, 1.0, 3.0],
+            successes=[True, True, False],
+            user_ids=["user1", "user1", "user2"],
+            file_sizes=[1000, None, None]
+        )
+        
+        assert metrics_collector.business_metrics.downloads_total == 2
+        assert metrics_collector.counters["downloads_total"] == 3
+        assert metrics_collector.platform_stats["youtube"]["downloads"] == 2
+        assert metrics_collector.platform_stats["tiktok"]["error_count"] == 1
+        assert metrics_collector.quality_stats["1080p"]["total_file_size"] == 1000
+        assert metrics_collector.user_sessions["user1"]["downloads"] == 2
+        
+        # One timestamp is shared by every event in the batch
+        assert len({event.timestamp for event in metrics_collector.metric_events}) == 1
+    
+    def test_track_downloads_batch_length_mismatch(self, metrics_collector):
+        """Test batches with mismatched sequence lengths are rejected."""
+        with pytest.raises(ValueError):
+            metrics_collector.track_downloads_batch(
+                ["youtube", "tiktok"], ["720p"], [1.0, 2.0], [True, True], ["u1", "u2"]
+            )
+        
+        assert metrics_collector.business_metrics.downloads_total == 0
+    
     def test_track_audio_extraction(self, metrics_collector):
         """Test tracking audio extraction events."""
         metrics_collector.track_audio_extraction(
@@ -167,6 +221,13 @@ class TestMetricsCollector:
         assert session["audio_extractions"] == 1
         assert "youtube" in session["platforms_used"]
     
+    def test_new_session_starts_at_event_time(self, metrics_collector):
+        """Test a user's first event sets first_visit and last_activity together."""
+        metrics_collector.track_download("youtube", "720p", 1.0, True, "user1")
+        
+        session = metrics_collector.user_sessions["user1"]
+        assert session["first_visit"] == session["last_activity"]
+    
     def test_track_cache_operation(self, metrics_collector):
         """Test tracking cache operations."""
         # Track cache hit
@@ -183,6 +244,17 @@ class TestMetricsCollector:
         # Check timers
         assert len(metrics_collector.timers["cache_response_time"]) == 2
     
+    def test_track_cache_operation_truthy_hit(self, metrics_collector):
+        """Test non-bool hit values are counted by their truthiness."""
+        metrics_collector.track_cache_operation("get", None, 0.001)
+        metrics_collector.track_cache_operation("get", "cached", 0.001)
+        
+        assert metrics_collector.counters["cache_hits"] == 1
+        assert metrics_collector.counters["cache_misses"] == 1
+        tags = [event.tags["hit"] for event in metrics_collector.metric_events
+                if event.metric_name == "cache_operations_total"]
+        assert tags == ["False", "True"]
+    
     def test_track_error(self, metrics_collector):
         """Test tracking error events."""
         metrics_collector.track_error(
@@ -394,6 +466,31 @@ class TestMetricsCollector:
         assert "overall_success_rate" in overview
         assert "cache_hit_rate" in overview
     
+    @patch('app.services.metrics_collector.performance_monitor')
+    @patch('app.services.metrics_collector.cache_manager')
+    def test_get_dashboard_data_cached(self, mock_cache_manager, mock_performance_monitor,
+                                       metrics_collector):
+        """Test dashboard data is reused within the TTL, copied per caller and rebuilt after tracking."""
+        mock_performance_monitor.get_performance_summary.return_value = {}
+        mock_performance_monitor.get_system_metrics.return_value = {}
+        mock_performance_monitor.get_health_status.return_value = {'health_score': 100}
+        mock_cache_manager.get_cache_stats.return_value = {}
+        metrics_collector.dashboard_cache_ttl = 60.0
+        
+        first = metrics_collector.get_dashboard_data()
+        first["overview"]["total_downloads"] = 99
+        cached = metrics_collector.get_dashboard_data()
+        assert cached is not first
+        assert cached["overview"]["total_downloads"] == 0
+        assert mock_performance_monitor.get_system_metrics.call_count == 1
+        
+        metrics_collector.track_download("youtube", "1080p", 2.0, True, "user1")
+        rebuilt = metrics_collector.get_dashboard_data()
+        
+        assert rebuilt is not first
+        assert rebuilt["overview"]["total_downloads"] == 1
+        assert mock_performance_monitor.get_system_metrics.call_count == 2
+    
     def test_export_metrics(self, metrics_collector, tmp_path):
         """Test exporting metrics to file."""
         # Add some test data
@@ -424,6 +521,71 @@ class TestMetricsCollector:
         assert "timestamp" in export_info
         assert "total_events" in export_info
     
+    def test_export_metrics_time_window(self, metrics_collector, tmp_path):
+        """Test only events inside the time window are exported."""
+        now = time.time()
+        metrics_collector.record_metric("old", 1, MetricType.COUNTER, timestamp=now - 7200)
+        metrics_collector.record_metric("older_edge", 1, MetricType.COUNTER, timestamp=now - 3700)
+        metrics_collector.record_metric("recent", 1, MetricType.COUNTER, timestamp=now - 60)
+        metrics_collector.record_metric("latest", 1, MetricType.COUNTER)
+        
+        export_file = tmp_path / "window.json"
+        metrics_collector.export_metrics(str(export_file), time_window_hours=1)
+        exported = json.loads(export_file.read_text())
+        
+        names = [event["metric_name"] for event in exported["metric_events"]]
+        assert names == ["recent", "latest"]
+        assert exported["export_info"]["total_events"] == 2
+    
+    def test_export_metrics_time_window_out_of_order(self, metrics_collector, tmp_path):
+        """Test events recorded out of timestamp order are still exported."""
+        now = time.time()
+        metrics_collector.record_metric("recent", 1, MetricType.COUNTER, timestamp=now - 60)
+        metrics_collector.record_metric("old", 1, MetricType.COUNTER, timestamp=now - 7200)
+        metrics_collector.record_metric("backdated", 1, MetricType.COUNTER, timestamp=now - 120)
+        
+        export_file = tmp_path / "unordered.json"
+        metrics_collector.export_metrics(str(export_file), time_window_hours=1)
+        exported = json.loads(export_file.read_text())
+        
+        names = [event["metric_name"] for event in exported["metric_events"]]
+        assert names == ["recent", "backdated"]
+    
+    def test_event_order_recovers_after_eviction(self):
+        """Test exports return to binary search once an out-of-order event's predecessor is evicted."""
+        collector = MetricsCollector(max_events_history=3)
+        now = time.time()
+        for name, offset in (("a", 50), ("b", 40), ("late", 45), ("c", 30)):
+            collector.record_metric(name, 1, MetricType.COUNTER, timestamp=now - offset)
+        assert collector._appends_until_ordered == 1
+        
+        collector.record_metric("d", 1, MetricType.COUNTER, timestamp=now - 20)
+        assert collector._appends_until_ordered == 0
+        assert [event.metric_name for event in collector.metric_events] == ["late", "c", "d"]
+    
+    def test_export_metrics_jsonl(self, metrics_collector, tmp_path):
+        """Test exporting metrics as JSON Lines."""
+        metrics_collector.track_download("youtube", "1080p", 2.0, True, "user1")
+        
+        export_file = tmp_path / "test_metrics.jsonl"
+        metrics_collector.export_metrics(str(export_file), time_window_hours=1,
+                                         export_format="jsonl")
+        
+        lines = export_file.read_text().splitlines()
+        header = json.loads(lines[0])
+        events = [json.loads(line) for line in lines[1:]]
+        
+        assert header["export_info"]["format"] == "jsonl"
+        assert header["export_info"]["total_events"] == len(events)
+        assert "metric_events" not in header
+        assert events[0]["metric_name"] == "downloads_total"
+        assert events[0]["metric_type"] == "counter"
+    
+    def test_export_metrics_invalid_format(self, metrics_collector, tmp_path):
+        """Test exporting with an unknown format is rejected."""
+        with pytest.raises(ValueError):
+            metrics_collector.export_metrics(str(tmp_path / "out.xml"), export_format="xml")
+    
     def test_histogram_memory_management(self, metrics_collector):
         """Test that histograms don't grow indefinitely."""
         # Add more than 1000 values to a histogram
@@ -522,6 +684,89 @@ class TestBusinessMetrics:
         assert metrics.user_retention_rate == 0.0
 
 
+class TestUserSession:
+    """Test suite for UserSession dataclass."""
+    
+    def test_user_session_item_access(self):
+        """Test sessions support dict-style reads and writes."""
+        session = UserSession(first_visit=1.0, last_activity=2.0)
+        
+        assert session["downloads"] == 0
+        session["downloads"] += 2
+        assert session.downloads == 2
+        assert session["platforms_used"] == set()
+    
+    def test_user_session_platforms_bitmask(self):
+        """Test platforms are stored as a bitmask behind a set-like view."""
+        session = UserSession(first_visit=1.0, last_activity=2.0)
+        
+        session["platforms_used"].add("youtube")
+        session["platforms_used"].add("tiktok")
+        session["platforms_used"].add("youtube")
+        
+        assert isinstance(session.platform_mask, int)
+        assert "youtube" in session["platforms_used"]
+        assert "vimeo" not in session["platforms_used"]
+        assert len(session["platforms_used"]) == 2
+        assert session["platforms_used"] == {"youtube", "tiktok"}
+    
+    def test_user_session_platforms_assignment(self):
+        """Test assigning a set of platforms updates the bitmask."""
+        session = UserSession(first_visit=1.0, last_activity=2.0)
+        
+        session["platforms_used"] = {"instagram", "reddit"}
+        
+        assert set(session.platforms_used) == {"instagram", "reddit"}
+    
+    def test_user_session_unknown_key(self):
+        """Test unknown keys raise KeyError like a dict."""
+        session = UserSession(first_visit=1.0, last_activity=2.0)
+        
+        with pytest.raises(KeyError):
+            session["unknown"]
+        with pytest.raises(KeyError):
+            session["unknown"] = 1
+    
+    def test_user_session_has_no_instance_dict(self):
+        """Test sessions are slotted."""
+        session = UserSession(first_visit=1.0, last_activity=2.0)
+        
+        assert not hasattr(session, "__dict__")
+
+
+class TestPlatformAndQualityStats:
+    """Test suite for PlatformStats and QualityStats records."""
+    
+    def test_platform_stats_defaults(self):
+        """Test platform stats start at zero and support item access."""
+        stats = PlatformStats()
+        
+        assert stats["downloads"] == 0
+        assert stats["success_rate"] == 0.0
+        stats["error_count"] += 1
+        assert stats.error_count == 1
+    
+    def test_quality_stats_defaults(self):
+        """Test quality stats start at zero and support item access."""
+        stats = QualityStats()
+        
+        assert stats["downloads"] == 0
+        assert stats["total_file_size"] == 0
+        assert stats["average_processing_time"] == 0.0
+    
+    def test_exported_stats_are_plain_objects(self, tmp_path):
+        """Test stats records export as JSON objects."""
+        collector = MetricsCollector(max_events_history=10)
+        collector.track_download("youtube", "720p", 1.0, True, "user1", 2048)
+        
+        export_file = tmp_path / "metrics.json"
+        collector.export_metrics(str(export_file))
+        exported = json.loads(export_file.read_text())
+        
+        assert exported["platform_stats"]["youtube"]["downloads"] == 1
+        assert exported["quality_stats"]["720p"]["total_file_size"] == 2048
+
+
 class TestMetricType:
     """Test suite for MetricType enum."""
     
@@ -540,4 +785,14 @@ class TestMetricType:
         assert MetricType("timer") == MetricType.TIMER
         
         with pytest.raises(ValueError):
-            MetricType("invalid_type")
\ No newline at end of file
+            MetricType("invalid_type")
+    
+    def test_coerce_metric_type(self):
+        """Test coercing values to metric types."""
+        assert coerce_metric_type("timer") is MetricType.TIMER
+        assert coerce_metric_type(MetricType.GAUGE) is MetricType.GAUGE
+        
+        with pytest.raises(ValueError):
+            coerce_metric_type("invalid_type")
+        with pytest.raises(ValueError):
+            coerce_metric_type(None)
\ No newline at end of file
@@ -5,218 +5,317 @@ This module tests the monitoring API endpoints that provide
 dashboard data, metrics, and performance monitoring.
 """
 
+import asyncio
+import mmap
 import pytest
-import json
-from unittest.mock import Mock, patch, MagicMock
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import orjson
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from httpx import AsyncClient, ASGITransport
 
-from app.main import app
+from app.api import monitoring
 from app.services.metrics_collector import MetricType
 
+# The spec'd mock is built once per module; introspecting the spec is the
+# expensive part of MagicMock construction.
+_METRICS_COLLECTOR_TEMPLATE = MagicMock(spec=monitoring.metrics_collector)
 
-class TestMonitoringDashboardAPI:
-    """Test suite for monitoring dashboard API endpoints."""
-    
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-    
-    @pytest.fixture
-    def mock_metrics_collector(self):
-        """Mock metrics collector for testing."""
-        with patch('app.api.monitoring.metrics_collector') as mock:
-            yield mock
-    
-    @pytest.fixture
-    def mock_performance_monitor(self):
-        """Mock performance monitor for testing."""
-        with patch('app.api.monitoring.performance_monitor') as mock:
-            yield mock
-    
-    @pytest.fixture
-    def mock_rate_limiter(self):
-        """Mock rate limiter for testing."""
-        with patch('app.api.monitoring.rate_limiter') as mock:
-            yield mock
-    
-    def test_get_dashboard_data_success(self, client, mock_metrics_collector):
-        """Test successful dashboard data retrieval."""
-        # Mock dashboard data
-        mock_dashboard_data = {
-            "overview": {
-                "total_downloads": 1000,
-                "total_audio_extractions": 250,
-                "total_operations": 1250,
-                "overall_success_rate": 95.5,
-                "cache_hit_rate": 85.0,
-                "active_users_24h": 150,
-                "system_health_score": 92,
-                "total_alerts": 2,
-                "critical_alerts": 0
-            },
-            "performance": {
-                "system_metrics": {
-                    "cpu_percent": 45.0,
-                    "memory_percent": 60.0,
-                    "timestamp": 1234567890
-                },
-                "performance_summary": {
-                    "total_requests": 5000,
-                    "average_response_time": 1.2,
-                    "error_rate": 2.5
-                },
-                "health_status": {
-                    "status": "healthy",
-                    "health_score": 92
-                }
-            },
-            "business_metrics": {
-                "platform_metrics": {
-                    "youtube": {
-                        "downloads": 600,
-                        "success_rate": 96.0,
-                        "popularity_rank": 1
-                    },
-                    "tiktok": {
-                        "downloads": 400,
-                        "success_rate": 94.0,
-                        "popularity_rank": 2
-                    }
-                },
-                "quality_metrics": {
-                    "1080p": {
-                        "downloads": 700,
-                        "usage_percentage": 70.0
-                    },
-                    "720p": {
-                        "downloads": 300,
-                        "usage_percentage": 30.0
-                    }
-                },
-                "user_engagement": {
-                    "total_users": 500,
-                    "active_users_24h": 150,
-                    "retention_rate": 65.0
-                }
-            },
-            "cache_performance": {
-                "hit_rate": 85.0,
-                "miss_rate": 15.0,
-                "total_operations": 2000,
-                "alerts": []
-            },
-            "alerts": [
-                {
-                    "level": "warning",
-                    "type": "cache_hit_rate",
-                    "message": "Cache hit rate low: 75.0%"
-                }
-            ],
+
+# Query-string JSON for the track-event tests, serialized once at import.
+_TAGS_JSON = orjson.dumps({"platform": "youtube", "quality": "1080p"}).decode()
+_METADATA_JSON = orjson.dumps({"test": True, "source": "api"}).decode()
+
+# Endpoints backed by the real monitoring singletons: URL, accepted status
+# codes and keys expected under "data".
+_LIVE_MONITORING_ENDPOINTS = [
+    ("/api/v1/monitoring/health", (200, 503), ()),
+    ("/api/v1/monitoring/metrics", (200,),
+     ("endpoint_stats", "performance_summary", "system_metrics")),
+    ("/api/v1/monitoring/system", (200,),
+     ("cpu_percent", "memory_percent", "timestamp")),
+    ("/api/v1/monitoring/alerts", (200,),
+     ("alerts", "alert_count", "thresholds")),
+]
+
+# Shape of the live dashboard payload, built once for the structure checks.
+_DASHBOARD_REQUIRED_KEYS = frozenset({
+    "overview", "performance", "business_metrics", "cache_performance", "alerts", "timestamp"
+})
+_OVERVIEW_NUMERIC_KEYS = frozenset({
+    "total_downloads", "total_audio_extractions", "total_operations", "overall_success_rate"
+})
+
+# Canned collector payloads shared by the tests below; none of them are
+# mutated by the endpoints, so a single instance is enough.
+_DASHBOARD_PAYLOAD = {
+    "overview": {
+        "total_downloads": 1000,
+        "total_audio_extractions": 250,
+        "total_operations": 1250,
+        "overall_success_rate": 95.5,
+        "cache_hit_rate": 85.0,
+        "active_users_24h": 150,
+        "system_health_score": 92,
+        "total_alerts": 2,
+        "critical_alerts": 0
+    },
+    "performance": {
+        "system_metrics": {
+            "cpu_percent": 45.0,
+            "memory_percent": 60.0,
             "timestamp": 1234567890
+        },
+        "performance_summary": {
+            "total_requests": 5000,
+            "average_response_time": 1.2,
+            "error_rate": 2.5
+        },
+        "health_status": {
+            "status": "healthy",
+            "health_score": 92
         }
-        
-        mock_metrics_collector.get_dashboard_data.return_value = mock_dashboard_data
-        
-        response = client.get("/api/v1/monitoring/dashboard")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["success"] is True
-        assert "data" in data
-        assert "response_time_ms" in data
-        
-        dashboard_data = data["data"]
-        assert dashboard_data["overview"]["total_downloads"] == 1000
-        assert dashboard_data["overview"]["total_audio_extractions"] == 250
-        assert dashboard_data["performance"]["system_metrics"]["cpu_percent"] == 45.0
-        assert len(dashboard_data["alerts"]) == 1
-        
-        mock_metrics_collector.get_dashboard_data.assert_called_once()
-    
-    def test_get_dashboard_data_error(self, client, mock_metrics_collector):
-        """Test dashboard data retrieval with error."""
-        mock_metrics_collector.get_dashboard_data.side_effect = Exception("Database error")
-        
-        response = client.get("/api/v1/monitoring/dashboard")
-        
-        assert response.status_code == 500
-        data = response.json()
-        
-        assert data["success"] is False
-        assert data["error"] == "dashboard_error"
-        assert "Database error" in data["details"]
-    
-    def test_get_business_metrics_success(self, client, mock_metrics_collector):
-        """Test successful business metrics retrieval."""
-        # Mock business metrics data
-        mock_platform_metrics = {
+    },
+    "business_metrics": {
+        "platform_metrics": {
             "youtube": {
                 "downloads": 600,
-                "audio_extractions": 150,
-                "total_operations": 750,
                 "success_rate": 96.0,
-                "error_count": 30,
-                "average_processing_time": 2.1,
                 "popularity_rank": 1
             },
             "tiktok": {
                 "downloads": 400,
-                "audio_extractions": 100,
-                "total_operations": 500,
                 "success_rate": 94.0,
-                "error_count": 32,
-                "average_processing_time": 1.8,
                 "popularity_rank": 2
             }
-        }
-        
-        mock_quality_metrics = {
+        },
+        "quality_metrics": {
             "1080p": {
                 "downloads": 700,
-                "average_file_size_mb": 45.2,
-                "average_processing_time": 2.5,
                 "usage_percentage": 70.0
             },
             "720p": {
                 "downloads": 300,
-                "average_file_size_mb": 25.1,
-                "average_processing_time": 1.8,
                 "usage_percentage": 30.0
             }
-        }
-        
-        mock_user_engagement = {
+        },
+        "user_engagement": {
             "total_users": 500,
             "active_users_24h": 150,
-            "returning_users": 325,
-            "retention_rate": 65.0,
-            "average_operations_per_user": 2.5,
-            "total_operations": 1250
+            "retention_rate": 65.0
+        }
+    },
+    "cache_performance": {
+        "hit_rate": 85.0,
+        "miss_rate": 15.0,
+        "total_operations": 2000,
+        "alerts": []
+    },
+    "alerts": [
+        {
+            "level": "warning",
+            "type": "cache_hit_rate",
+            "message": "Cache hit rate low: 75.0%"
+        }
+    ],
+    "timestamp": 1234567890
+}
+
+_PLATFORM_METRICS_PAYLOAD = {
+    "youtube": {
+        "downloads": 600,
+        "audio_extractions": 150,
+        "total_operations": 750,
+        "success_rate": 96.0,
+        "error_count": 30,
+        "average_processing_time": 2.1,
+        "popularity_rank": 1
+    },
+    "tiktok": {
+        "downloads": 400,
+        "audio_extractions": 100,
+        "total_operations": 500,
+        "success_rate": 94.0,
+        "error_count": 32,
+        "average_processing_time": 1.8,
+        "popularity_rank": 2
+    }
+}
+
+_QUALITY_METRICS_PAYLOAD = {
+    "1080p": {
+        "downloads": 700,
+        "average_file_size_mb": 45.2,
+        "average_processing_time": 2.5,
+        "usage_percentage": 70.0
+    },
+    "720p": {
+        "downloads": 300,
+        "average_file_size_mb": 25.1,
+        "average_processing_time": 1.8,
+        "usage_percentage": 30.0
+    }
+}
+
+_USER_ENGAGEMENT_PAYLOAD = {
+    "total_users": 500,
+    "active_users_24h": 150,
+    "returning_users": 325,
+    "retention_rate": 65.0,
+    "average_operations_per_user": 2.5,
+    "total_operations": 1250
+}
+
+_CACHE_METRICS_PAYLOAD = {
+    "hit_rate": 85.5,
+    "miss_rate": 14.5,
+    "total_operations": 2000,
+    "hits": 1710,
+    "misses": 290,
+    "average_response_time_ms": 1.2,
+    "cache_manager_stats": {
+        "hit_rate": 85.5,
+        "total_requests": 2000
+    },
+    "alerts": [
+        {
+            "level": "warning",
+            "type": "cache_hit_rate",
+            "message": "Cache hit rate low: 75.0%",
+            "threshold": 80.0
         }
+    ],
+    "timestamp": 1234567890
+}
+
+_PERFORMANCE_ALERTS_PAYLOAD = [
+    {
+        "level": "critical",
+        "type": "platform_success_rate",
+        "platform": "instagram",
+        "message": "instagram success rate critical: 75.0%",
+        "threshold": 80.0
+    },
+    {
+        "level": "warning",
+        "type": "cache_hit_rate",
+        "message": "Cache hit rate low: 78.0%",
+        "threshold": 80.0
+    },
+    {
+        "level": "warning",
+        "type": "processing_time",
+        "platform": "facebook",
+        "message": "facebook processing time high: 6.5s",
+        "threshold": 5.0
+    }
+]
+
+_ALERT_THRESHOLDS_PAYLOAD = {
+    "cache_hit_rate_warning": 80.0,
+    "cache_hit_rate_critical": 60.0,
+    "download_success_rate_warning": 90.0,
+    "download_success_rate_critical": 80.0,
+    "average_processing_time_warning": 5.0,
+    "average_processing_time_critical": 10.0
+}
+
+
+def _ok(response):
+    """Assert a successful monitoring response and return its decoded body."""
+    assert response.status_code == 200
+    data = orjson.loads(response.content)
+    assert data["success"] is True
+    assert "data" in data
+    return data
+
+
+def _reset_template(template):
+    """Clear calls, return values and side effects left by a previous test."""
+    template.reset_mock(return_value=True, side_effect=True)
+    return template
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """Create one in-process async client shared by every test in this module."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def dashboard_response(client):
+    """Fetch the live dashboard once for the read-only tests that inspect it."""
+    return await client.get("/api/v1/monitoring/dashboard")
+
+
+@pytest.fixture(scope="class")
+def _patched_monitoring():
+    """Patch the monitoring metrics collector once for the requesting test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(monitoring, 'metrics_collector', _METRICS_COLLECTOR_TEMPLATE)
+        yield SimpleNamespace(metrics_collector=_METRICS_COLLECTOR_TEMPLATE)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestMonitoringDashboardAPI:
+    """Test suite for monitoring dashboard API endpoints."""
+    
+    @pytest.fixture(autouse=True)
+    def mocks(self, _patched_monitoring):
+        """Patched monitoring mocks, reset before each test."""
+        for mock in vars(_patched_monitoring).values():
+            _reset_template(mock)
+        return _patched_monitoring
+    
+    async def test_get_dashboard_data_success(self, client, mocks):
+        """Test successful dashboard data retrieval."""
+        mocks.metrics_collector.get_dashboard_data.return_value = _DASHBOARD_PAYLOAD
         
-        # Mock business metrics object
-        mock_business_metrics = Mock()
-        mock_business_metrics.downloads_total = 1000
-        mock_business_metrics.audio_extractions_total = 250
-        mock_business_metrics.downloads_by_platform = {"youtube": 600, "tiktok": 400}
-        mock_business_metrics.downloads_by_quality = {"1080p": 700, "720p": 300}
+        response = await client.get("/api/v1/monitoring/dashboard")
         
-        mock_metrics_collector.get_platform_metrics.return_value = mock_platform_metrics
-        mock_metrics_collector.get_quality_metrics.return_value = mock_quality_metrics
-        mock_metrics_collector.get_user_engagement_metrics.return_value = mock_user_engagement
-        mock_metrics_collector.business_metrics = mock_business_metrics
+        data = _ok(response)
+        assert "response_time_ms" in data
         
-        response = client.get("/api/v1/monitoring/business-metrics")
+        dashboard_data = data["data"]
+        assert dashboard_data["overview"]["total_downloads"] == 1000
+        assert dashboard_data["overview"]["total_audio_extractions"] == 250
+        assert dashboard_data["performance"]["system_metrics"]["cpu_percent"] == 45.0
+        assert len(dashboard_data["alerts"]) == 1
         
-        assert response.status_code == 200
+        mocks.metrics_collector.get_dashboard_data.assert_called_once()
+    
+    async def test_get_dashboard_data_error(self, client, mocks):
+        """Test dashboard data retrieval with error."""
+        mocks.metrics_collector.get_dashboard_data.side_effect = Exception("Database error")
+        
+        response = await client.get("/api/v1/monitoring/dashboard")
+        
+        assert response.status_code == 500
         data = response.json()
         
-        assert data["success"] is True
-        assert "data" in data
+        assert data["success"] is False
+        assert data["error"] == "dashboard_error"
+        assert "Database error" in data["details"]
+    
+    async def test_get_business_metrics_success(self, client, mocks):
+        """Test successful business metrics retrieval."""
+        # Plain attribute bag; nothing here needs call tracking
+        mock_business_metrics = SimpleNamespace(
+            downloads_total=1000,
+            audio_extractions_total=250,
+            downloads_by_platform={"youtube": 600, "tiktok": 400},
+            downloads_by_quality={"1080p": 700, "720p": 300}
+        )
+        
+        mocks.metrics_collector.get_platform_metrics.return_value = _PLATFORM_METRICS_PAYLOAD
+        mocks.metrics_collector.get_quality_metrics.return_value = _QUALITY_METRICS_PAYLOAD
+        mocks.metrics_collector.get_user_engagement_metrics.return_value = _USER_ENGAGEMENT_PAYLOAD
+        mocks.metrics_collector.business_metrics = mock_business_metrics
+        
+        response = await client.get("/api/v1/monitoring/business-metrics")
         
-        business_data = data["data"]
+        business_data = _ok(response)["data"]
         assert "platform_metrics" in business_data
         assert "quality_metrics" in business_data
         assert "user_engagement" in business_data
@@ -232,39 +331,13 @@ class TestMonitoringDashboardAPI:
         assert summary["total_audio_extractions"] == 250
         assert summary["downloads_by_platform"]["youtube"] == 600
     
-    def test_get_cache_metrics_success(self, client, mock_metrics_collector):
+    async def test_get_cache_metrics_success(self, client, mocks):
         """Test successful cache metrics retrieval."""
-        mock_cache_metrics = {
-            "hit_rate": 85.5,
-            "miss_rate": 14.5,
-            "total_operations": 2000,
-            "hits": 1710,
-            "misses": 290,
-            "average_response_time_ms": 1.2,
-            "cache_manager_stats": {
-                "hit_rate": 85.5,
-                "total_requests": 2000
-            },
-            "alerts": [
-                {
-                    "level": "warning",
-                    "type": "cache_hit_rate",
-                    "message": "Cache hit rate low: 75.0%",
-                    "threshold": 80.0
-                }
-            ],
-            "timestamp": 1234567890
-        }
+        mocks.metrics_collector.get_cache_metrics.return_value = _CACHE_METRICS_PAYLOAD
         
-        mock_metrics_collector.get_cache_metrics.return_value = mock_cache_metrics
+        response = await client.get("/api/v1/monitoring/cache-metrics")
         
-        response = client.get("/api/v1/monitoring/cache-metrics")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["success"] is True
-        cache_data = data["data"]
+        cache_data = _ok(response)["data"]
         
         assert cache_data["hit_rate"] == 85.5
         assert cache_data["miss_rate"] == 14.5
@@ -272,50 +345,14 @@ class TestMonitoringDashboardAPI:
         assert len(cache_data["alerts"]) == 1
         assert cache_data["alerts"][0]["level"] == "warning"
     
-    def test_get_performance_alerts_success(self, client, mock_metrics_collector):
+    async def test_get_performance_alerts_success(self, client, mocks):
         """Test successful performance alerts retrieval."""
-        mock_alerts = [
-            {
-                "level": "critical",
-                "type": "platform_success_rate",
-                "platform": "instagram",
-                "message": "instagram success rate critical: 75.0%",
-                "threshold": 80.0
-            },
-            {
-                "level": "warning",
-                "type": "cache_hit_rate",
-                "message": "Cache hit rate low: 78.0%",
-                "threshold": 80.0
-            },
-            {
-                "level": "warning",
-                "type": "processing_time",
-                "platform": "facebook",
-                "message": "facebook processing time high: 6.5s",
-                "threshold": 5.0
-            }
-        ]
-        
-        mock_thresholds = {
-            "cache_hit_rate_warning": 80.0,
-            "cache_hit_rate_critical": 60.0,
-            "download_success_rate_warning": 90.0,
-            "download_success_rate_critical": 80.0,
-            "average_processing_time_warning": 5.0,
-            "average_processing_time_critical": 10.0
-        }
-        
-        mock_metrics_collector.get_performance_alerts.return_value = mock_alerts
-        mock_metrics_collector.alert_thresholds = mock_thresholds
-        
-        response = client.get("/api/v1/monitoring/performance-alerts")
+        mocks.metrics_collector.get_performance_alerts.return_value = _PERFORMANCE_ALERTS_PAYLOAD
+        mocks.metrics_collector.alert_thresholds = _ALERT_THRESHOLDS_PAYLOAD
         
-        assert response.status_code == 200
-        data = response.json()
+        response = await client.get("/api/v1/monitoring/performance-alerts")
         
-        assert data["success"] is True
-        alerts_data = data["data"]
+        alerts_data = _ok(response)["data"]
         
         assert len(alerts_data["alerts"]) == 3
         assert alerts_data["summary"]["total_alerts"] == 3
@@ -334,23 +371,20 @@ class TestMonitoringDashboardAPI:
         # Check thresholds
         assert alerts_data["thresholds"]["cache_hit_rate_warning"] == 80.0
     
-    def test_track_metric_event_success(self, client, mock_metrics_collector):
+    async def test_track_metric_event_success(self, client, mocks):
         """Test successful metric event tracking."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/track-event",
             params={
                 "metric_name": "custom_downloads",
                 "value": 5,
                 "metric_type": "counter",
-                "tags": '{"platform": "youtube", "quality": "1080p"}',
-                "metadata": '{"test": true, "source": "api"}'
+                "tags": _TAGS_JSON,
+                "metadata": _METADATA_JSON
             }
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["success"] is True
+        data = _ok(response)
         assert data["message"] == "Metric event tracked successfully"
         
         event_data = data["data"]
@@ -361,15 +395,15 @@ class TestMonitoringDashboardAPI:
         assert event_data["metadata"]["test"] is True
         
         # Verify metrics collector was called
-        mock_metrics_collector.record_metric.assert_called_once()
-        call_args = mock_metrics_collector.record_metric.call_args
+        mocks.metrics_collector.record_metric.assert_called_once()
+        call_args = mocks.metrics_collector.record_metric.call_args
         assert call_args[1]["name"] == "custom_downloads"
         assert call_args[1]["value"] == 5
         assert call_args[1]["metric_type"] == MetricType.COUNTER
     
-    def test_track_metric_event_invalid_metric_type(self, client, mock_metrics_collector):
+    async def test_track_metric_event_invalid_metric_type(self, client, mocks):
         """Test metric event tracking with invalid metric type."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/track-event",
             params={
                 "metric_name": "test_metric",
@@ -386,34 +420,19 @@ class TestMonitoringDashboardAPI:
         assert "counter" in data["message"]
         assert "gauge" in data["message"]
     
-    def test_track_metric_event_invalid_tags_json(self, client, mock_metrics_collector):
-        """Test metric event tracking with invalid tags JSON."""
-        response = client.post(
-            "/api/v1/monitoring/track-event",
-            params={
-                "metric_name": "test_metric",
-                "value": 1,
-                "metric_type": "counter",
-                "tags": "invalid json"
-            }
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        
-        assert data["success"] is False
-        assert data["error"] == "invalid_tags"
-        assert "valid JSON" in data["message"]
-    
-    def test_track_metric_event_invalid_metadata_json(self, client, mock_metrics_collector):
-        """Test metric event tracking with invalid metadata JSON."""
-        response = client.post(
+    @pytest.mark.parametrize("param, raw_value, error", [
+        ("tags", "invalid json", "invalid_tags"),
+        ("metadata", "{invalid: json}", "invalid_metadata"),
+    ])
+    async def test_track_metric_event_invalid_json_param(self, client, mocks, param, raw_value, error):
+        """Test metric event tracking with invalid tags or metadata JSON."""
+        response = await client.post(
             "/api/v1/monitoring/track-event",
             params={
                 "metric_name": "test_metric",
                 "value": 1,
                 "metric_type": "counter",
-                "metadata": "{invalid: json}"
+                param: raw_value
             }
         )
         
@@ -421,12 +440,12 @@ class TestMonitoringDashboardAPI:
         data = response.json()
         
         assert data["success"] is False
-        assert data["error"] == "invalid_metadata"
+        assert data["error"] == error
         assert "valid JSON" in data["message"]
     
-    def test_track_metric_event_no_optional_params(self, client, mock_metrics_collector):
+    async def test_track_metric_event_no_optional_params(self, client, mocks):
         """Test metric event tracking without optional parameters."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/track-event",
             params={
                 "metric_name": "simple_metric",
@@ -435,71 +454,61 @@ class TestMonitoringDashboardAPI:
             }
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["success"] is True
-        event_data = data["data"]
+        event_data = _ok(response)["data"]
         assert event_data["tags"] == {}
         assert event_data["metadata"] == {}
     
-    def test_export_metrics_success(self, client, mock_metrics_collector):
+    async def test_export_metrics_success(self, client, mocks):
         """Test successful metrics export."""
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/export",
             params={"time_window_hours": 12}
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["success"] is True
+        data = _ok(response)
         assert "exported_file" in data["data"]
         assert "timestamp" in data["data"]
         assert data["data"]["time_window_hours"] == 12
         assert "Metrics exported" in data["message"]
         
         # Verify export was called with correct parameters
-        mock_metrics_collector.export_metrics.assert_called_once()
-        call_args = mock_metrics_collector.export_metrics.call_args
+        mocks.metrics_collector.export_metrics.assert_called_once()
+        call_args = mocks.metrics_collector.export_metrics.call_args
         assert call_args[0][1] == 12  # time_window_hours parameter
     
-    def test_export_metrics_default_time_window(self, client, mock_metrics_collector):
+    async def test_export_metrics_default_time_window(self, client, mocks):
         """Test metrics export with default time window."""
-        response = client.post("/api/v1/monitoring/export")
-        
-        assert response.status_code == 200
-        data = response.json()
+        response = await client.post("/api/v1/monitoring/export")
         
-        assert data["success"] is True
+        data = _ok(response)
         assert data["data"]["time_window_hours"] == 24  # Default value
         
         # Verify export was called with default time window
-        mock_metrics_collector.export_metrics.assert_called_once()
-        call_args = mock_metrics_collector.export_metrics.call_args
+        mocks.metrics_collector.export_metrics.assert_called_once()
+        call_args = mocks.metrics_collector.export_metrics.call_args
         assert call_args[0][1] == 24  # Default time_window_hours
     
-    def test_export_metrics_invalid_time_window(self, client, mock_metrics_collector):
+    async def test_export_metrics_invalid_time_window(self, client, mocks):
         """Test metrics export with invalid time window."""
         # Test time window too small
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/export",
             params={"time_window_hours": 0}
         )
         assert response.status_code == 422  # Validation error
         
         # Test time window too large
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/export",
             params={"time_window_hours": 200}
         )
         assert response.status_code == 422  # Validation error
     
-    def test_export_metrics_error(self, client, mock_metrics_collector):
+    async def test_export_metrics_error(self, client, mocks):
         """Test metrics export with error."""
-        mock_metrics_collector.export_metrics.side_effect = Exception("File write error")
+        mocks.metrics_collector.export_metrics.side_effect = Exception("File write error")
         
-        response = client.post("/api/v1/monitoring/export")
+        response = await client.post("/api/v1/monitoring/export")
         
         assert response.status_code == 500
         data = response.json()
@@ -507,69 +516,30 @@ class TestMonitoringDashboardAPI:
         assert data["success"] is False
         assert data["error"] == "export_error"
         assert "File write error" in data["details"]
-    
-    def test_health_endpoint_integration(self, client):
-        """Test health endpoint integration with monitoring."""
-        response = client.get("/api/v1/monitoring/health")
-        
-        # Should return some response (exact content depends on system state)
-        assert response.status_code in [200, 503]  # Healthy or unhealthy
-        data = response.json()
-        assert "success" in data
-        assert "data" in data
-    
-    def test_metrics_endpoint_integration(self, client):
-        """Test metrics endpoint integration."""
-        response = client.get("/api/v1/monitoring/metrics")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "data" in data
-        
-        metrics_data = data["data"]
-        assert "endpoint_stats" in metrics_data
-        assert "performance_summary" in metrics_data
-        assert "system_metrics" in metrics_data
-    
-    def test_system_metrics_endpoint_integration(self, client):
-        """Test system metrics endpoint integration."""
-        response = client.get("/api/v1/monitoring/system")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "data" in data
-        
-        system_data = data["data"]
-        assert "cpu_percent" in system_data
-        assert "memory_percent" in system_data
-        assert "timestamp" in system_data
-    
-    def test_alerts_endpoint_integration(self, client):
-        """Test alerts endpoint integration."""
-        response = client.get("/api/v1/monitoring/alerts")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "data" in data
-        
-        alerts_data = data["data"]
-        assert "alerts" in alerts_data
-        assert "alert_count" in alerts_data
-        assert "thresholds" in alerts_data
 
 
 class TestMonitoringDashboardIntegration:
     """Integration tests for monitoring dashboard functionality."""
     
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_live_monitoring_endpoints_integration(self, client):
+        """Test the live health, metrics, system and alerts endpoints together."""
+        responses = await asyncio.gather(
+            *(client.get(url) for url, _, _ in _LIVE_MONITORING_ENDPOINTS)
+        )
+        
+        for (url, statuses, data_keys), response in zip(_LIVE_MONITORING_ENDPOINTS, responses):
+            # Health may legitimately report 503 depending on system state
+            assert response.status_code in statuses, url
+            data = response.json()
+            assert "success" in data, url
+            assert "data" in data, url
+            if statuses == (200,):
+                assert data["success"] is True, url
+            for key in data_keys:
+                assert key in data["data"], f"{url} missing {key}"
     
-    def test_dashboard_html_accessibility(self, client):
+    def test_dashboard_html_accessibility(self):
         """Test that admin dashboard HTML is accessible."""
         # Note: This would require serving static files in test environment
         # For now, we'll test that the file exists
@@ -577,58 +547,62 @@ class TestMonitoringDashboardIntegration:
         dashboard_path = "static/admin-dashboard.html"
         assert os.path.exists(dashboard_path)
         
-        # Verify HTML contains expected elements
-        with open(dashboard_path, 'r') as f:
-            content = f.read()
-            assert "VidNet Admin Dashboard" in content
-            assert "totalDownloads" in content
-            assert "cacheHitRate" in content
-            assert "platformChart" in content
+        # Verify HTML contains expected elements, searching the mapped
+        # bytes rather than decoding the whole page into a str
+        with open(dashboard_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for needle in (b"VidNet Admin Dashboard", b"totalDownloads",
+                           b"cacheHitRate", b"platformChart"):
+                assert content.find(needle) != -1, f"Missing {needle.decode()}"
     
-    def test_dashboard_api_endpoints_exist(self, client):
-        """Test that all expected dashboard API endpoints exist."""
-        endpoints = [
-            "/api/v1/monitoring/dashboard",
-            "/api/v1/monitoring/business-metrics",
-            "/api/v1/monitoring/cache-metrics",
-            "/api/v1/monitoring/performance-alerts",
-            "/api/v1/monitoring/health",
-            "/api/v1/monitoring/metrics",
-            "/api/v1/monitoring/system"
-        ]
-        
-        for endpoint in endpoints:
-            response = client.get(endpoint)
-            # Should not return 404 (endpoint exists)
-            assert response.status_code != 404
-            # Should return JSON response
-            assert response.headers.get("content-type", "").startswith("application/json")
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize("endpoint", [
+        # The dashboard itself is covered through the dashboard_response fixture
+        "/api/v1/monitoring/business-metrics",
+        "/api/v1/monitoring/cache-metrics",
+        "/api/v1/monitoring/performance-alerts",
+        "/api/v1/monitoring/health",
+        "/api/v1/monitoring/metrics",
+        "/api/v1/monitoring/system"
+    ])
+    async def test_dashboard_api_endpoints_exist(self, client, endpoint):
+        """Test that each expected dashboard API endpoint exists."""
+        response = await client.get(endpoint)
+        # Should not return 404 (endpoint exists)
+        assert response.status_code != 404
+        # Should return JSON response
+        assert response.headers.get("content-type", "").startswith("application/json")
     
-    def test_dashboard_data_structure_consistency(self, client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_dashboard_data_structure_consistency(self, dashboard_response):
         """Test that dashboard data has consistent structure."""
-        response = client.get("/api/v1/monitoring/dashboard")
+        response = dashboard_response
+        assert response.status_code != 404
+        assert response.headers.get("content-type", "").startswith("application/json")
         
         if response.status_code == 200:
-            data = response.json()
-            assert data["success"] is True
-            
-            dashboard_data = data["data"]
+            dashboard_data = _ok(response)["data"]
             
             # Check required top-level keys
-            required_keys = ["overview", "performance", "business_metrics", "cache_performance", "alerts", "timestamp"]
-            for key in required_keys:
-                assert key in dashboard_data, f"Missing required key: {key}"
+            missing = _DASHBOARD_REQUIRED_KEYS - dashboard_data.keys()
+            assert not missing, f"Missing required keys: {sorted(missing)}"
             
             # Check overview structure
             overview = dashboard_data["overview"]
-            overview_keys = ["total_downloads", "total_audio_extractions", "total_operations", "overall_success_rate"]
-            for key in overview_keys:
-                assert key in overview, f"Missing overview key: {key}"
-                assert isinstance(overview[key], (int, float)), f"Invalid type for {key}"
+            missing = _OVERVIEW_NUMERIC_KEYS - overview.keys()
+            assert not missing, f"Missing overview keys: {sorted(missing)}"
+            invalid = sorted(
+                key for key in _OVERVIEW_NUMERIC_KEYS
+                if not isinstance(overview[key], (int, float))
+            )
+            assert not invalid, f"Invalid types for: {invalid}"
     
-    @patch('app.api.monitoring.metrics_collector')
-    def test_metrics_collection_workflow(self, mock_collector, client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_metrics_collection_workflow(self, client, monkeypatch):
         """Test complete metrics collection workflow."""
+        mock_collector = _reset_template(_METRICS_COLLECTOR_TEMPLATE)
+        monkeypatch.setattr(monitoring, 'metrics_collector', mock_collector)
+        
         # Mock a complete workflow
         mock_collector.track_download.return_value = None
         mock_collector.track_cache_operation.return_value = None
@@ -642,7 +616,7 @@ class TestMonitoringDashboardIntegration:
         }
         
         # Simulate tracking events
-        response = client.post(
+        response = await client.post(
             "/api/v1/monitoring/track-event",
             params={
                 "metric_name": "test_download",
@@ -653,7 +627,7 @@ class TestMonitoringDashboardIntegration:
         assert response.status_code == 200
         
         # Get dashboard data
-        response = client.get("/api/v1/monitoring/dashboard")
+        response = await client.get("/api/v1/monitoring/dashboard")
         assert response.status_code == 200
         
         # Verify metrics collector was used
@@ -5,11 +5,13 @@ This module tests the comprehensive platform detection functionality
 for all supported video platforms.
 """
 
+import time
 import pytest
 from app.services.platform_detector import (
     PlatformDetector,
     PlatformInfo,
     detect_platform,
+    detect_platforms,
     validate_video_url,
     normalize_url,
     get_supported_platforms,
@@ -22,154 +24,178 @@ from app.services.platform_detector import (
     validate_twitter_url,
     validate_reddit_url,
     validate_vimeo_url,
+    _lookup_host,
+    _VIDEO_EXTENSIONS,
+)
+
+
+YOUTUBE_URLS = (
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+    'https://youtu.be/dQw4w9WgXcQ',
+    'https://youtube.com/watch?v=dQw4w9WgXcQ',
+    'https://www.youtube.com/embed/dQw4w9WgXcQ',
+    'https://www.youtube.com/v/dQw4w9WgXcQ',
+    'https://www.youtube.com/shorts/dQw4w9WgXcQ',
+    'https://music.youtube.com/watch?v=dQw4w9WgXcQ',
+    'https://www.youtube.com/live/dQw4w9WgXcQ',
+    'youtube.com/watch?v=dQw4w9WgXcQ',  # Without protocol
+    'www.youtube.com/watch?v=dQw4w9WgXcQ',  # Without protocol
+)
+
+TIKTOK_URLS = (
+    'https://www.tiktok.com/@username/video/1234567890123456789',
+    'https://tiktok.com/@user.name/video/9876543210987654321',
+    'https://vm.tiktok.com/ZMeAbCdEf',
+    'https://vt.tiktok.com/ZSAbCdEfG',
+    'https://www.tiktok.com/t/ZTAbCdEfH',
+    'https://m.tiktok.com/v/1234567890123456789',
+    'tiktok.com/@username/video/1234567890123456789',  # Without protocol
+)
+
+INSTAGRAM_URLS = (
+    'https://www.instagram.com/p/ABC123DEF456/',
+    'https://instagram.com/p/XYZ789GHI012/',
+    'https://www.instagram.com/reel/DEF456ABC123/',
+    'https://www.instagram.com/tv/GHI789DEF456/',
+    'https://www.instagram.com/stories/username/1234567890',
+    'instagram.com/p/ABC123DEF456/',  # Without protocol
+)
+
+FACEBOOK_URLS = (
+    'https://www.facebook.com/watch/?v=1234567890123456',
+    'https://facebook.com/watch?v=9876543210987654',
+    'https://www.facebook.com/username/videos/1234567890123456',
+    'https://www.facebook.com/video.php?v=1234567890123456',
+    'https://fb.watch/AbCdEfGhIj',
+    'https://m.facebook.com/watch/?v=1234567890123456',
+    'facebook.com/watch/?v=1234567890123456',  # Without protocol
+)
+
+TWITTER_URLS = (
+    'https://twitter.com/username/status/1234567890123456789',
+    'https://www.twitter.com/user_name/status/9876543210987654321',
+    'https://x.com/username/status/1234567890123456789',
+    'https://www.x.com/user_name/status/9876543210987654321',
+    'https://twitter.com/i/web/status/1234567890123456789',
+    'https://x.com/i/web/status/9876543210987654321',
+    'https://mobile.twitter.com/username/status/1234567890123456789',
+    'twitter.com/username/status/1234567890123456789',  # Without protocol
+)
+
+REDDIT_URLS = (
+    'https://www.reddit.com/r/videos/comments/abc123/title_here/',
+    'https://reddit.com/r/funny/comments/xyz789/another_title/',
+    'https://v.redd.it/abcdef123456',
+    'https://old.reddit.com/r/videos/comments/abc123/title_here/',
+    'https://m.reddit.com/r/videos/comments/abc123/title_here/',
+    'reddit.com/r/videos/comments/abc123/title_here/',  # Without protocol
+)
+
+VIMEO_URLS = (
+    'https://vimeo.com/123456789',
+    'https://www.vimeo.com/987654321',
+    'https://player.vimeo.com/video/123456789',
+    'https://vimeo.com/ondemand/movie-name/123456789',
+    'https://vimeo.com/channels/channel-name/123456789',
+    'vimeo.com/123456789',  # Without protocol
+)
+
+DIRECT_URLS = (
+    'https://example.com/video.mp4',
+    'https://cdn.example.com/path/to/video.avi',
+    'https://storage.example.com/videos/movie.mov',
+    'https://files.example.com/content.mkv',
+    'https://media.example.com/stream.webm',
+    'https://assets.example.com/clip.flv',
+    'https://example.com/video.m4v',
+    'https://example.com/video.3gp',
+    'https://example.com/video.wmv',
+    'https://example.com/video.ogv',
+    'https://example.com/video.mpg',
+    'https://example.com/video.mpeg',
+    'https://example.com/video.ts',
+    'https://example.com/video.mp4?param=value',  # With query parameters
+    'example.com/video.mp4',  # Without protocol
+)
+
+UNSUPPORTED_URLS = (
+    'https://example.com/page',
+    'https://unsupported-platform.com/video/123',
+    'https://google.com',
+    'not-a-url',
+    '',
+    None,
+)
+
+VALID_URLS = (
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+    'https://www.tiktok.com/@username/video/1234567890123456789',
+    'https://example.com/video.mp4',
+)
+
+INVALID_URLS = (
+    '',
+    None,
+    'not-a-url',
+    'https://unsupported-platform.com/video/123',
+)
+
+MALFORMED_URLS = (
+    'not-a-url',
+    'http://',
+    'https://',
+    'ftp://example.com/video.mp4',
+    'javascript:alert("test")',
 )
 
 
 class TestPlatformDetector:
     """Test cases for the PlatformDetector class."""
     
-    def test_detect_platform_youtube(self):
+    @pytest.mark.parametrize('url', YOUTUBE_URLS)
+    def test_detect_platform_youtube(self, url):
         """Test YouTube URL detection."""
-        youtube_urls = [
-            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
-            'https://youtu.be/dQw4w9WgXcQ',
-            'https://youtube.com/watch?v=dQw4w9WgXcQ',
-            'https://www.youtube.com/embed/dQw4w9WgXcQ',
-            'https://www.youtube.com/v/dQw4w9WgXcQ',
-            'https://www.youtube.com/shorts/dQw4w9WgXcQ',
-            'https://music.youtube.com/watch?v=dQw4w9WgXcQ',
-            'https://www.youtube.com/live/dQw4w9WgXcQ',
-            'youtube.com/watch?v=dQw4w9WgXcQ',  # Without protocol
-            'www.youtube.com/watch?v=dQw4w9WgXcQ',  # Without protocol
-        ]
-        
-        for url in youtube_urls:
-            assert PlatformDetector.detect_platform(url) == 'youtube', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'youtube'
     
-    def test_detect_platform_tiktok(self):
+    @pytest.mark.parametrize('url', TIKTOK_URLS)
+    def test_detect_platform_tiktok(self, url):
         """Test TikTok URL detection."""
-        tiktok_urls = [
-            'https://www.tiktok.com/@username/video/1234567890123456789',
-            'https://tiktok.com/@user.name/video/9876543210987654321',
-            'https://vm.tiktok.com/ZMeAbCdEf',
-            'https://vt.tiktok.com/ZSAbCdEfG',
-            'https://www.tiktok.com/t/ZTAbCdEfH',
-            'https://m.tiktok.com/v/1234567890123456789',
-            'tiktok.com/@username/video/1234567890123456789',  # Without protocol
-        ]
-        
-        for url in tiktok_urls:
-            assert PlatformDetector.detect_platform(url) == 'tiktok', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'tiktok'
     
-    def test_detect_platform_instagram(self):
+    @pytest.mark.parametrize('url', INSTAGRAM_URLS)
+    def test_detect_platform_instagram(self, url):
         """Test Instagram URL detection."""
-        instagram_urls = [
-            'https://www.instagram.com/p/ABC123DEF456/',
-            'https://instagram.com/p/XYZ789GHI012/',
-            'https://www.instagram.com/reel/DEF456ABC123/',
-            'https://www.instagram.com/tv/GHI789DEF456/',
-            'https://www.instagram.com/stories/username/1234567890',
-            'instagram.com/p/ABC123DEF456/',  # Without protocol
-        ]
-        
-        for url in instagram_urls:
-            assert PlatformDetector.detect_platform(url) == 'instagram', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'instagram'
     
-    def test_detect_platform_facebook(self):
+    @pytest.mark.parametrize('url', FACEBOOK_URLS)
+    def test_detect_platform_facebook(self, url):
         """Test Facebook URL detection."""
-        facebook_urls = [
-            'https://www.facebook.com/watch/?v=1234567890123456',
-            'https://facebook.com/watch?v=9876543210987654',
-            'https://www.facebook.com/username/videos/1234567890123456',
-            'https://www.facebook.com/video.php?v=1234567890123456',
-            'https://fb.watch/AbCdEfGhIj',
-            'https://m.facebook.com/watch/?v=1234567890123456',
-            'facebook.com/watch/?v=1234567890123456',  # Without protocol
-        ]
-        
-        for url in facebook_urls:
-            assert PlatformDetector.detect_platform(url) == 'facebook', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'facebook'
     
-    def test_detect_platform_twitter(self):
+    @pytest.mark.parametrize('url', TWITTER_URLS)
+    def test_detect_platform_twitter(self, url):
         """Test Twitter/X URL detection."""
-        twitter_urls = [
-            'https://twitter.com/username/status/1234567890123456789',
-            'https://www.twitter.com/user_name/status/9876543210987654321',
-            'https://x.com/username/status/1234567890123456789',
-            'https://www.x.com/user_name/status/9876543210987654321',
-            'https://twitter.com/i/web/status/1234567890123456789',
-            'https://x.com/i/web/status/9876543210987654321',
-            'https://mobile.twitter.com/username/status/1234567890123456789',
-            'twitter.com/username/status/1234567890123456789',  # Without protocol
-        ]
-        
-        for url in twitter_urls:
-            assert PlatformDetector.detect_platform(url) == 'twitter', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'twitter'
     
-    def test_detect_platform_reddit(self):
+    @pytest.mark.parametrize('url', REDDIT_URLS)
+    def test_detect_platform_reddit(self, url):
         """Test Reddit URL detection."""
-        reddit_urls = [
-            'https://www.reddit.com/r/videos/comments/abc123/title_here/',
-            'https://reddit.com/r/funny/comments/xyz789/another_title/',
-            'https://v.redd.it/abcdef123456',
-            'https://old.reddit.com/r/videos/comments/abc123/title_here/',
-            'https://m.reddit.com/r/videos/comments/abc123/title_here/',
-            'reddit.com/r/videos/comments/abc123/title_here/',  # Without protocol
-        ]
-        
-        for url in reddit_urls:
-            assert PlatformDetector.detect_platform(url) == 'reddit', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'reddit'
     
-    def test_detect_platform_vimeo(self):
+    @pytest.mark.parametrize('url', VIMEO_URLS)
+    def test_detect_platform_vimeo(self, url):
         """Test Vimeo URL detection."""
-        vimeo_urls = [
-            'https://vimeo.com/123456789',
-            'https://www.vimeo.com/987654321',
-            'https://player.vimeo.com/video/123456789',
-            'https://vimeo.com/ondemand/movie-name/123456789',
-            'https://vimeo.com/channels/channel-name/123456789',
-            'vimeo.com/123456789',  # Without protocol
-        ]
-        
-        for url in vimeo_urls:
-            assert PlatformDetector.detect_platform(url) == 'vimeo', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'vimeo'
     
-    def test_detect_platform_direct_video_links(self):
+    @pytest.mark.parametrize('url', DIRECT_URLS)
+    def test_detect_platform_direct_video_links(self, url):
         """Test direct video link detection."""
-        direct_urls = [
-            'https://example.com/video.mp4',
-            'https://cdn.example.com/path/to/video.avi',
-            'https://storage.example.com/videos/movie.mov',
-            'https://files.example.com/content.mkv',
-            'https://media.example.com/stream.webm',
-            'https://assets.example.com/clip.flv',
-            'https://example.com/video.m4v',
-            'https://example.com/video.3gp',
-            'https://example.com/video.wmv',
-            'https://example.com/video.ogv',
-            'https://example.com/video.mpg',
-            'https://example.com/video.mpeg',
-            'https://example.com/video.ts',
-            'https://example.com/video.mp4?param=value',  # With query parameters
-            'example.com/video.mp4',  # Without protocol
-        ]
-        
-        for url in direct_urls:
-            assert PlatformDetector.detect_platform(url) == 'direct', f"Failed for URL: {url}"
+        assert PlatformDetector.detect_platform(url) == 'direct'
     
-    def test_detect_platform_unsupported(self):
+    @pytest.mark.parametrize('url', UNSUPPORTED_URLS)
+    def test_detect_platform_unsupported(self, url):
         """Test detection of unsupported platforms."""
-        unsupported_urls = [
-            'https://example.com/page',
-            'https://unsupported-platform.com/video/123',
-            'https://google.com',
-            'not-a-url',
-            '',
-            None,
-        ]
-        
-        for url in unsupported_urls:
-            assert PlatformDetector.detect_platform(url) is None, f"Should be None for URL: {url}"
+        assert PlatformDetector.detect_platform(url) is None
     
     def test_extract_platform_info_youtube(self):
         """Test extracting platform info for YouTube URLs."""
@@ -214,34 +240,29 @@ class TestPlatformDetector:
         assert info.video_id == 'abc123'
         assert 'subreddit' in info.metadata
         assert info.metadata['subreddit'] == 'videos'
-    
-    def test_validate_url_valid(self):
+
+    def test_platform_info_is_immutable(self):
+        """Test that PlatformInfo instances are frozen and slotted."""
+        info = PlatformDetector.extract_platform_info('https://youtu.be/dQw4w9WgXcQ')
+
+        assert not hasattr(info, '__dict__')
+        with pytest.raises(AttributeError):
+            info.name = 'vimeo'
+
+    @pytest.mark.parametrize('url', VALID_URLS)
+    def test_validate_url_valid(self, url):
         """Test URL validation for valid URLs."""
-        valid_urls = [
-            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
-            'https://www.tiktok.com/@username/video/1234567890123456789',
-            'https://example.com/video.mp4',
-        ]
-        
-        for url in valid_urls:
-            result = PlatformDetector.validate_url(url)
-            assert result['is_valid'] is True, f"Should be valid for URL: {url}"
-            assert result['platform'] is not None
-            assert result['error'] is None
+        result = PlatformDetector.validate_url(url)
+        assert result['is_valid'] is True
+        assert result['platform'] is not None
+        assert result['error'] is None
     
-    def test_validate_url_invalid(self):
+    @pytest.mark.parametrize('url', INVALID_URLS)
+    def test_validate_url_invalid(self, url):
         """Test URL validation for invalid URLs."""
-        invalid_urls = [
-            '',
-            None,
-            'not-a-url',
-            'https://unsupported-platform.com/video/123',
-        ]
-        
-        for url in invalid_urls:
-            result = PlatformDetector.validate_url(url)
-            assert result['is_valid'] is False, f"Should be invalid for URL: {url}"
-            assert result['error'] is not None
+        result = PlatformDetector.validate_url(url)
+        assert result['is_valid'] is False
+        assert result['error'] is not None
     
     def test_validate_url_adds_https(self):
         """Test that validation adds https:// to URLs without protocol."""
@@ -354,12 +375,21 @@ class TestPlatformDetector:
             ('https://example.com/video.mkv', '.mkv'),
             ('https://example.com/stream.webm', '.webm'),
             ('https://example.com/video.mp4?param=value', '.mp4'),
+            ('https://example.com/broadcast.m2ts', '.m2ts'),  # Not cut short to '.ts'
+            ('https://example.com/CLIP.MTS', '.mts'),
             ('https://www.youtube.com/watch?v=dQw4w9WgXcQ', None),  # Not a direct link
         ]
         
         for url, expected_ext in test_cases:
             ext = PlatformDetector.get_video_extension(url)
             assert ext == expected_ext, f"Failed for {url}: got {ext}, expected {expected_ext}"
+
+    @pytest.mark.parametrize('ext', sorted(_VIDEO_EXTENSIONS))
+    def test_every_known_extension_is_a_direct_link(self, ext):
+        """Test that the direct-link pattern covers each recognised extension."""
+        url = f'https://example.com/clip{ext}?t=1'
+        assert PlatformDetector.detect_platform(url) == 'direct'
+        assert PlatformDetector.get_video_extension(url) == ext
     
     def test_preprocess_url(self):
         """Test URL preprocessing functionality."""
@@ -370,6 +400,15 @@ class TestPlatformDetector:
         assert 'fbclid' not in processed
         assert 'v=dQw4w9WgXcQ' in processed
         
+        # A leading tracking parameter leaves a well-formed query behind
+        processed = PlatformDetector._preprocess_url('https://example.com/clip.mp4?gclid=1&t=3')
+        assert processed == 'https://example.com/clip.mp4?t=3'
+        assert PlatformDetector.detect_platform('https://example.com/clip.mp4?gclid=1&t=3') == 'direct'
+        
+        # A click ID alone is enough to trigger stripping
+        normalized = PlatformDetector.normalize_url('https://www.tiktok.com/@u/video/123?msclkid=abc')
+        assert 'msclkid' not in normalized
+        
         # Test protocol addition
         url_without_protocol = 'youtube.com/watch?v=dQw4w9WgXcQ'
         processed = PlatformDetector._preprocess_url(url_without_protocol)
@@ -385,6 +424,17 @@ class TestConvenienceFunctions:
         platform = detect_platform(url)
         assert platform == 'youtube'
     
+    def test_detect_platforms_function(self):
+        """Test the detect_platforms batch convenience function."""
+        urls = [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://example.com/page',
+            None,
+            'https://vimeo.com/123456789',
+        ]
+        assert detect_platforms(urls) == ['youtube', None, None, 'vimeo']
+        assert detect_platforms(iter(urls)) == [detect_platform(url) for url in urls]
+    
     def test_validate_video_url_function(self):
         """Test the validate_video_url convenience function."""
         url = 'https://www.youtube.com/watch?v=dQw4w9WgXcQ'
@@ -462,21 +512,13 @@ class TestEdgeCases:
             assert result['is_valid'] is False
             assert result['error'] is not None
     
-    def test_malformed_urls(self):
+    @pytest.mark.parametrize('url', MALFORMED_URLS)
+    def test_malformed_urls(self, url):
         """Test handling of malformed URLs."""
-        malformed_urls = [
-            'not-a-url',
-            'http://',
-            'https://',
-            'ftp://example.com/video.mp4',
-            'javascript:alert("test")',
-        ]
-        
-        for url in malformed_urls:
-            result = PlatformDetector.validate_url(url)
-            # Most should be invalid, but some might be handled gracefully
-            if not result['is_valid']:
-                assert result['error'] is not None
+        result = PlatformDetector.validate_url(url)
+        # Most should be invalid, but some might be handled gracefully
+        if not result['is_valid']:
+            assert result['error'] is not None
     
     def test_urls_with_special_characters(self):
         """Test handling of URLs with special characters."""
@@ -511,6 +553,18 @@ class TestEdgeCases:
         assert result['is_valid'] is True
         assert result['platform'] == 'youtube'
     
+    def test_long_unmatched_url_is_linear(self):
+        """Test that a URL matching no platform is rejected in linear time."""
+        long_url = 'https://example.com/page?' + '&'.join(f'k{i}=v{i}' for i in range(10000))
+        
+        start = time.perf_counter()
+        assert PlatformDetector.detect_platform(long_url) is None
+        assert PlatformDetector.validate_url(long_url)['is_valid'] is False
+        elapsed = time.perf_counter() - start
+        
+        # Quadratic backtracking took tens of seconds on a URL this long
+        assert elapsed < 2.0, f"Rejecting a {len(long_url)}-char URL took {elapsed:.2f}s"
+    
     def test_case_insensitive_detection(self):
         """Test that platform detection is case-insensitive."""
         case_variants = [
@@ -522,6 +576,58 @@ class TestEdgeCases:
         for url in case_variants:
             assert PlatformDetector.detect_platform(url) == 'youtube', f"Failed for: {url}"
     
+    def test_host_platform_takes_precedence(self):
+        """Test that the URL's own host decides over URLs embedded in the query."""
+        url = 'https://www.tiktok.com/@user/video/123?ref=youtube.com/watch?v=abc'
+        assert PlatformDetector.detect_platform(url) == 'tiktok'
+
+        # Hosts that merely contain an alias are not treated as that platform
+        assert PlatformDetector._platform_for_host('https://evilyoutube.com/watch?v=abc') is None
+        assert PlatformDetector._platform_for_host('https://youtube.com.evil.org/x') is None
+        assert PlatformDetector._platform_for_host('https://music.youtube.com/x') == 'youtube'
+
+    def test_cached_validation_results_are_independent(self):
+        """Test that memoized validation hands out fresh, mutable results."""
+        url = 'https://www.reddit.com/r/videos/comments/abc123/title/'
+        first = PlatformDetector.validate_url(url)
+        first['metadata']['subreddit'] = 'changed'
+        first['warnings'].append('changed')
+
+        second = PlatformDetector.validate_url(url)
+        assert second['metadata'] == {'subreddit': 'videos'}
+        assert second['warnings'] == []
+
+        PlatformDetector.cache_clear()
+        assert PlatformDetector._detect_platform_cached.cache_info().currsize == 0
+        assert PlatformDetector.validate_url(url) == second
+
+    def test_url_prefixes_agree_with_host_trie(self):
+        """Test that the prefix fast path resolves hosts the same way as the trie."""
+        for prefix, platform in PlatformDetector._URL_PREFIXES.items():
+            host = prefix.split('//', 1)[1].rstrip('/')
+            assert _lookup_host(PlatformDetector._HOST_TRIE, host) == platform, prefix
+
+        # Prefixes that only look alike still go through URL parsing
+        assert PlatformDetector._platform_for_host('https://evil.com?x=/www.youtube.com/') is None
+        assert PlatformDetector._platform_for_host('https://user@www.youtube.com/x') == 'youtube'
+
+    def test_prefilter_admits_every_detectable_url(self):
+        """Test that the pre-filter never rejects a URL some pattern matches."""
+        urls = [
+            'https://music.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://VM.TIKTOK.COM/ZMeAbCdEf',
+            'https://mobile.x.com/user/status/1234567890',
+            'https://v.redd.it/abcdef123456',
+            'https://player.vimeo.com/video/123456789',
+            'https://cdn.example.org/clip.M2TS?token=1',
+        ]
+        for url in urls:
+            assert PlatformDetector._ANY_KNOWN.search(url), url
+            assert PlatformDetector.detect_platform(url) is not None, url
+
+        for url in ('https://google.com', 'https://example.com/page', 'https://example.com/mp4'):
+            assert not PlatformDetector._ANY_KNOWN.search(url), url
+
     def test_international_domains(self):
         """Test handling of international domain variants."""
         # Note: These might not all be real, but testing the robustness
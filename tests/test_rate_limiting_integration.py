@@ -7,31 +7,119 @@ integration with the FastAPI application.
 
 import asyncio
 import time
+from collections import defaultdict, deque
+import psutil
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, AsyncMock
+from fastapi import Request
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import AsyncMock
 
 from app.main import app
 from app.middleware.rate_limiter import rate_limiter
-from app.services.performance_monitor import performance_monitor
+from app.services.performance_monitor import PerformanceMetrics, performance_monitor
+
+
+# Allowance reported by the stubbed rate limiter; the middleware only reads it
+_RATE_LIMIT_INFO = {
+    'requests_per_minute': 1,
+    'requests_per_hour': 1,
+    'minute_limit': 60,
+    'hour_limit': 1000,
+    'reset_time': int(time.time()) + 3600
+}
+
+# httpx stores header names lowercased, so these match keys() directly
+_RATE_LIMIT_HEADERS = frozenset({
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+})
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    """Run this module's async tests and fixtures on one shared asyncio loop."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_rate_limiter():
+    """Answer rate limit checks in this module without Redis or degradation."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rate_limiter, 'is_rate_limited', AsyncMock(return_value=(False, _RATE_LIMIT_INFO)))
+        mp.setattr(rate_limiter, 'should_degrade_service', lambda: False)
+        yield
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_net_connections():
+    """Skip the socket table walk behind the active connection count."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(psutil, 'net_connections', lambda kind='inet': [])
+        yield
+
+
+@pytest.fixture(scope="module")
+async def async_client():
+    """Create one in-process async client shared by every test in this module."""
+    # The transport does not run the app's startup and shutdown hooks
+    # (download/storage managers, monitoring loop), which these tests do not need
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def _make_request(headers, client=("127.0.0.1", 0)):
+    """Build a real Starlette request carrying the given headers and peer."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": client,
+    })
+
+
+def _assert_ok(response, *keys):
+    """Assert a successful monitoring envelope whose data has every key; return the data."""
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    body = data["data"]
+    missing = set(keys) - body.keys()
+    assert not missing, f"missing from response data: {sorted(missing)}"
+    return body
+
 
+# Read-only monitoring endpoints fetched together by monitoring_responses
+MONITORING_ENDPOINTS = (
+    "/api/v1/monitoring/health",
+    "/api/v1/monitoring/metrics",
+    "/api/v1/monitoring/rate-limit-stats",
+    "/api/v1/monitoring/system",
+    "/api/v1/monitoring/dashboard",
+    "/api/v1/monitoring/alerts",
+)
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
+@pytest.fixture(scope="module")
+async def monitoring_responses(async_client):
+    """Fetch every read-only monitoring endpoint once, concurrently."""
+    responses = await asyncio.gather(*(async_client.get(path) for path in MONITORING_ENDPOINTS))
+    return dict(zip(MONITORING_ENDPOINTS, responses))
 
-def test_health_endpoint_available(client):
+
+@pytest.mark.anyio
+async def test_health_endpoint_available(async_client):
     """Test that health endpoint is available."""
-    response = client.get("/health")
+    response = await async_client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
 
-def test_monitoring_health_endpoint(client):
+@pytest.mark.anyio
+async def test_monitoring_health_endpoint(monitoring_responses):
     """Test monitoring health endpoint."""
-    response = client.get("/api/v1/monitoring/health")
+    response = monitoring_responses["/api/v1/monitoring/health"]
     assert response.status_code in [200, 503]  # May be degraded during testing
     
     data = response.json()
@@ -41,109 +129,136 @@ def test_monitoring_health_endpoint(client):
         assert "status" in data["data"]
 
 
-def test_monitoring_metrics_endpoint(client):
+@pytest.mark.anyio
+async def test_monitoring_metrics_endpoint(monitoring_responses):
     """Test monitoring metrics endpoint."""
-    response = client.get("/api/v1/monitoring/metrics")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
-    assert "endpoint_stats" in data["data"]
-    assert "system_metrics" in data["data"]
+    _assert_ok(monitoring_responses["/api/v1/monitoring/metrics"], "endpoint_stats", "system_metrics")
 
 
-def test_rate_limit_stats_endpoint(client):
+@pytest.mark.anyio
+async def test_rate_limit_stats_endpoint(monitoring_responses):
     """Test rate limit statistics endpoint."""
-    response = client.get("/api/v1/monitoring/rate-limit-stats")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
+    _assert_ok(monitoring_responses["/api/v1/monitoring/rate-limit-stats"])
 
 
-def test_system_metrics_endpoint(client):
+@pytest.mark.anyio
+async def test_system_metrics_endpoint(monitoring_responses):
     """Test system metrics endpoint."""
-    response = client.get("/api/v1/monitoring/system")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
-    
-    system_data = data["data"]
-    assert "cpu_percent" in system_data
-    assert "memory_percent" in system_data
-    assert "timestamp" in system_data
+    _assert_ok(monitoring_responses["/api/v1/monitoring/system"], "cpu_percent", "memory_percent", "timestamp")
 
 
-def test_performance_monitoring_tracks_requests(client):
+@pytest.mark.xdist_group("performance_monitor")
+@pytest.mark.anyio
+async def test_performance_monitoring_tracks_requests(async_client, monkeypatch):
     """Test that performance monitoring tracks requests correctly."""
-    # Clear existing metrics
-    performance_monitor.request_metrics.clear()
-    performance_monitor.endpoint_stats.clear()
+    # Start from empty metrics; the originals are put back after the test
+    monkeypatch.setattr(performance_monitor, 'request_metrics',
+                        deque(maxlen=performance_monitor.request_metrics.maxlen))
+    monkeypatch.setattr(performance_monitor, 'endpoint_stats',
+                        defaultdict(performance_monitor.endpoint_stats.default_factory))
     
-    # Make some test requests
-    for i in range(5):
-        response = client.get("/health")
-        assert response.status_code == 200
+    # Make some concurrent test requests on one event loop
+    responses = await asyncio.gather(*(async_client.get("/health") for _ in range(5)))
+    assert all(response.status_code == 200 for response in responses)
     
-    # Check that metrics were recorded
-    endpoint_stats = performance_monitor.get_endpoint_stats()
+    # Check that metrics were recorded, including any still queued for the
+    # recorder worker (get_endpoint_stats flushes too; this makes it explicit)
+    performance_monitor.flush()
+    endpoint_stats = performance_monitor.get_endpoint_stats("GET /health")
     
     # Should have recorded the health endpoint requests
-    health_endpoint_found = False
-    for endpoint, stats in endpoint_stats.items():
-        if "/health" in endpoint:
-            health_endpoint_found = True
-            assert stats["total_requests"] >= 5
-            break
-    
-    assert health_endpoint_found, "Health endpoint statistics not found"
+    assert "GET /health" in endpoint_stats, "Health endpoint statistics not found"
+    assert endpoint_stats["GET /health"]["total_requests"] >= 5
 
 
-def test_rate_limiting_headers_present(client):
+@pytest.mark.anyio
+@pytest.mark.parametrize("path", MONITORING_ENDPOINTS)
+async def test_rate_limiting_headers_present(monitoring_responses, path):
     """Test that rate limiting headers are present in responses."""
-    # Mock rate limiter to avoid Redis dependency in tests
-    with patch.object(rate_limiter, 'is_rate_limited', return_value=(False, {
-        'requests_per_minute': 1,
-        'requests_per_hour': 1,
-        'minute_limit': 60,
-        'hour_limit': 1000,
-        'reset_time': int(time.time() + 60)
-    })):
-        response = client.get("/api/v1/monitoring/health")
-        
-        # Check for rate limiting headers
-        assert "X-RateLimit-Limit" in response.headers
-        assert "X-RateLimit-Remaining" in response.headers
-        assert "X-RateLimit-Reset" in response.headers
+    # The rate limiter is stubbed for the whole module, so no Redis is needed
+    response = monitoring_responses[path]
+    
+    # Check for rate limiting headers in one pass over the header names
+    assert _RATE_LIMIT_HEADERS <= response.headers.keys()
 
 
-@pytest.mark.asyncio
-async def test_rate_limiter_initialization():
+@pytest.mark.anyio
+async def test_rate_limiter_initialization(monkeypatch):
     """Test rate limiter initialization."""
+    # Put the shared limiter's client back afterwards, so a connection opened
+    # on this test's event loop does not leak into later tests
+    monkeypatch.setattr(rate_limiter, 'redis_client', rate_limiter.redis_client)
+    
     # Test that rate limiter can be initialized
     await rate_limiter.initialize()
+    await rate_limiter.cleanup()
     
     # Test client ID extraction
-    from fastapi import Request
+    request = _make_request({"X-Forwarded-For": "192.168.1.1, 10.0.0.1"})
+    client_id = rate_limiter.get_client_id(request)
+    assert client_id == "192.168.1.1"  # Should use first forwarded IP
+
+
+@pytest.mark.parametrize("headers, client, expected", [
+    ({"X-Forwarded-For": "203.0.113.7"}, ("127.0.0.1", 0), "203.0.113.7"),
+    ({"x-forwarded-for": " 198.51.100.2 , 10.0.0.1, 10.0.0.2"}, ("127.0.0.1", 0), "198.51.100.2"),
+    ({"X-Real-IP": "192.0.2.4"}, ("127.0.0.1", 0), "192.0.2.4"),
+    ({}, ("127.0.0.1", 0), "127.0.0.1"),
+    ({}, None, "unknown"),
+], ids=["forwarded", "forwarded-chain", "real-ip", "direct", "no-client"])
+def test_get_client_id(headers, client, expected):
+    """Test client ID extraction from proxy headers and the socket peer."""
+    assert rate_limiter.get_client_id(_make_request(headers, client)) == expected
+
+
+@pytest.mark.xdist_group("performance_monitor")
+def test_system_metrics_reuse_connection_count(monkeypatch):
+    """Test that the connection count is re-counted only once per TTL."""
+    calls = []
+    monkeypatch.setattr(psutil, 'net_connections', lambda kind='inet': calls.append(kind) or [None] * 3)
+    monkeypatch.setattr(psutil, 'cpu_percent', lambda interval=None: 0.0)
+    monkeypatch.setattr(performance_monitor, '_connections_count', 0)
+    monkeypatch.setattr(performance_monitor, '_connections_checked_at', None)
     
-    # Mock request object
-    class MockClient:
-        host = "127.0.0.1"
+    first = performance_monitor.get_system_metrics()
+    second = performance_monitor.get_system_metrics()
+    assert first['active_connections'] == second['active_connections'] == 3
+    assert calls == ['inet']
     
-    class MockRequest:
-        client = MockClient()
-        headers = {"X-Forwarded-For": "192.168.1.1, 10.0.0.1"}
+    monkeypatch.setattr(performance_monitor, 'connections_ttl', 0.0)
+    performance_monitor.get_system_metrics()
+    assert len(calls) == 2
+
+
+@pytest.mark.xdist_group("performance_monitor")
+@pytest.mark.anyio
+async def test_performance_monitor_queues_requests_while_monitoring(monkeypatch):
+    """Test that queued request metrics are visible to readers and survive stop."""
+    monkeypatch.setattr(performance_monitor, 'endpoint_stats',
+                        defaultdict(performance_monitor.endpoint_stats.default_factory))
     
-    request = MockRequest()
-    client_id = rate_limiter.get_client_id(request)
-    assert client_id == "192.168.1.1"  # Should use first forwarded IP
+    def record(path):
+        performance_monitor.record_request(PerformanceMetrics(
+            timestamp=time.time(), endpoint=path, method="GET",
+            response_time=0.01, status_code=200, client_id="test"
+        ))
+    
+    await performance_monitor.start_monitoring()
+    try:
+        record("/queued")
+        assert performance_monitor._pending_metrics.qsize() == 1
+        assert performance_monitor.get_endpoint_stats("GET /queued")["GET /queued"]["total_requests"] == 1
+        
+        record("/queued")
+    finally:
+        await performance_monitor.stop_monitoring()
+    
+    assert performance_monitor._pending_metrics is None
+    assert performance_monitor.get_endpoint_stats("GET /queued")["GET /queued"]["total_requests"] == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group("performance_monitor")
+@pytest.mark.anyio
 async def test_performance_monitor_initialization():
     """Test performance monitor initialization."""
     # Test that performance monitor can start and stop
@@ -154,68 +269,49 @@ async def test_performance_monitor_initialization():
     assert performance_monitor._monitoring_active is False
 
 
-def test_graceful_degradation_response_format(client):
+@pytest.mark.anyio
+async def test_graceful_degradation_response_format(async_client, monkeypatch):
     """Test graceful degradation response format."""
-    # Mock degradation condition
-    with patch.object(rate_limiter, 'should_degrade_service', return_value=True):
-        # Test download endpoint (should be degraded)
-        response = client.post(
-            "/api/v1/download",
-            json={
-                "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-                "quality": "720p",
-                "format": "video"
-            }
-        )
-        
-        # Should return service degraded response
-        assert response.status_code == 503
-        data = response.json()
-        assert data["success"] is False
-        assert data["error"] == "service_degraded"
-        assert "retry_after" in data
+    # Force the degradation condition
+    monkeypatch.setattr(rate_limiter, 'should_degrade_service', lambda: True)
+    
+    # Test download endpoint (should be degraded)
+    response = await async_client.post(
+        "/api/v1/download",
+        json={
+            "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "quality": "720p",
+            "format": "video"
+        }
+    )
+    
+    # Should return service degraded response
+    assert response.status_code == 503
+    data = response.json()
+    assert data["success"] is False
+    assert data["error"] == "service_degraded"
+    assert "retry_after" in data
 
 
-def test_monitoring_dashboard_endpoint(client):
+@pytest.mark.anyio
+async def test_monitoring_dashboard_endpoint(monitoring_responses):
     """Test monitoring dashboard endpoint."""
-    response = client.get("/api/v1/monitoring/dashboard")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
-    
-    dashboard_data = data["data"]
-    assert "overview" in dashboard_data
-    assert "health_status" in dashboard_data
-    assert "endpoint_stats" in dashboard_data
-    assert "rate_limit_metrics" in dashboard_data
+    _assert_ok(
+        monitoring_responses["/api/v1/monitoring/dashboard"],
+        "overview", "health_status", "endpoint_stats", "rate_limit_metrics"
+    )
 
 
-def test_performance_alerts_endpoint(client):
+@pytest.mark.anyio
+async def test_performance_alerts_endpoint(monitoring_responses):
     """Test performance alerts endpoint."""
-    response = client.get("/api/v1/monitoring/alerts")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
-    
-    alerts_data = data["data"]
-    assert "alerts" in alerts_data
-    assert "alert_count" in alerts_data
-    assert "thresholds" in alerts_data
+    _assert_ok(monitoring_responses["/api/v1/monitoring/alerts"], "alerts", "alert_count", "thresholds")
 
 
-def test_export_metrics_endpoint(client):
+@pytest.mark.anyio
+async def test_export_metrics_endpoint(async_client):
     """Test metrics export endpoint."""
-    response = client.post("/api/v1/monitoring/export")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert data["success"] is True
-    assert "data" in data
-    assert "exported_file" in data["data"]
+    _assert_ok(await async_client.post("/api/v1/monitoring/export"), "exported_file")
 
 
 if __name__ == "__main__":
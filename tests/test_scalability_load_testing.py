@@ -10,6 +10,8 @@ import time
 import statistics
 import json
 import logging
+from bisect import bisect_right
+from collections import Counter
 from typing import List, Dict, Any, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
@@ -26,6 +28,14 @@ from app.services.performance_monitor import performance_monitor
 logger = logging.getLogger(__name__)
 
 
+def _percentile(sorted_times: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of an already sorted list of response times."""
+    if not sorted_times:
+        return 0
+    index = int(len(sorted_times) * percentile / 100)
+    return sorted_times[min(index, len(sorted_times) - 1)]
+
+
 @dataclass
 class LoadTestConfig:
     """Configuration for load tests."""
@@ -45,9 +55,9 @@ class LoadTestConfig:
             ]
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestResult:
-    """Result of a single request."""
+    """Result of a single request (one per request, so without a __dict__)."""
     endpoint: str
     method: str
     status_code: int
@@ -98,15 +108,12 @@ class LoadTestResults:
     
     def get_percentile(self, percentile: float) -> float:
         """Get response time percentile."""
-        if not self.response_times:
-            return 0
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * percentile / 100)
-        return sorted_times[min(index, len(sorted_times) - 1)]
+        return _percentile(sorted(self.response_times), percentile)
     
     def get_summary(self) -> Dict[str, Any]:
         """Get test results summary."""
-        response_times = self.response_times
+        # Sort once; min, max, median and every percentile read the same list
+        response_times = sorted(self.response_times)
         
         return {
             'config': asdict(self.config),
@@ -117,12 +124,12 @@ class LoadTestResults:
             'success_rate': self.success_rate,
             'requests_per_second': self.requests_per_second,
             'response_times': {
-                'min': min(response_times) if response_times else 0,
-                'max': max(response_times) if response_times else 0,
+                'min': response_times[0] if response_times else 0,
+                'max': response_times[-1] if response_times else 0,
                 'mean': statistics.mean(response_times) if response_times else 0,
                 'median': statistics.median(response_times) if response_times else 0,
-                'p95': self.get_percentile(95),
-                'p99': self.get_percentile(99)
+                'p95': _percentile(response_times, 95),
+                'p99': _percentile(response_times, 99)
             },
             'status_codes': self._get_status_code_distribution(),
             'endpoint_stats': self._get_endpoint_stats(),
@@ -131,44 +138,44 @@ class LoadTestResults:
     
     def _get_status_code_distribution(self) -> Dict[int, int]:
         """Get distribution of status codes."""
-        distribution = {}
-        for request in self.requests:
-            code = request.status_code
-            distribution[code] = distribution.get(code, 0) + 1
-        return distribution
+        return dict(Counter(r.status_code for r in self.requests))
     
     def _get_endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics per endpoint."""
         endpoint_stats = {}
         
-        for endpoint in self.config.endpoints:
-            endpoint_requests = [r for r in self.requests if r.endpoint == endpoint]
-            if not endpoint_requests:
+        # Group in one pass instead of rescanning every request per endpoint
+        totals = {endpoint: 0 for endpoint in self.config.endpoints}
+        successful_times = {endpoint: [] for endpoint in self.config.endpoints}
+        for r in self.requests:
+            if r.endpoint in totals:
+                totals[r.endpoint] += 1
+                if r.success:
+                    successful_times[r.endpoint].append(r.response_time)
+        
+        for endpoint, total in totals.items():
+            if not total:
                 continue
             
-            successful = [r for r in endpoint_requests if r.success]
-            response_times = [r.response_time for r in successful]
+            response_times = sorted(successful_times[endpoint])
             
             endpoint_stats[endpoint] = {
-                'total_requests': len(endpoint_requests),
-                'successful_requests': len(successful),
-                'success_rate': (len(successful) / len(endpoint_requests) * 100) if endpoint_requests else 0,
+                'total_requests': total,
+                'successful_requests': len(response_times),
+                'success_rate': len(response_times) / total * 100,
                 'avg_response_time': statistics.mean(response_times) if response_times else 0,
-                'p95_response_time': sorted(response_times)[int(len(response_times) * 0.95)] if response_times else 0
+                'p95_response_time': _percentile(response_times, 95)
             }
         
         return endpoint_stats
     
     def _get_error_analysis(self) -> Dict[str, Any]:
         """Get error analysis."""
-        errors = [r.error for r in self.requests if r.error]
-        error_counts = {}
-        for error in errors:
-            error_counts[error] = error_counts.get(error, 0) + 1
+        error_counts = Counter(r.error for r in self.requests if r.error)
         
         return {
-            'total_errors': len(errors),
-            'error_types': error_counts,
+            'total_errors': error_counts.total(),
+            'error_types': dict(error_counts),
             'error_rate_by_time': self._get_error_rate_by_time()
         }
     
@@ -182,42 +189,50 @@ class LoadTestResults:
         start_time = min(r.timestamp for r in self.requests)
         end_time = max(r.timestamp for r in self.requests)
         
-        intervals = []
-        current_time = start_time
-        
-        while current_time < end_time:
-            interval_end = current_time + interval_seconds
-            interval_requests = [
-                r for r in self.requests 
-                if current_time <= r.timestamp < interval_end
-            ]
-            
-            if interval_requests:
-                errors = sum(1 for r in interval_requests if not r.success)
-                error_rate = (errors / len(interval_requests) * 100) if interval_requests else 0
-                
-                intervals.append({
-                    'start_time': current_time,
-                    'end_time': interval_end,
-                    'total_requests': len(interval_requests),
-                    'errors': errors,
-                    'error_rate': error_rate
-                })
-            
-            current_time = interval_end
-        
-        return intervals
+        # Interval edges from start_time up to the first one at or past end_time
+        edges = [start_time]
+        while edges[-1] < end_time:
+            edges.append(edges[-1] + interval_seconds)
+        
+        # Bucket every request in one pass; a request exactly on the last
+        # edge falls outside the final half-open interval and is not counted
+        totals = [0] * (len(edges) - 1)
+        errors = [0] * (len(edges) - 1)
+        for r in self.requests:
+            index = bisect_right(edges, r.timestamp) - 1
+            if index < len(totals):
+                totals[index] += 1
+                if not r.success:
+                    errors[index] += 1
+        
+        return [
+            {
+                'start_time': edges[index],
+                'end_time': edges[index + 1],
+                'total_requests': total,
+                'errors': errors[index],
+                'error_rate': errors[index] / total * 100
+            }
+            for index, total in enumerate(totals)
+            if total
+        ]
 
 
 class LoadTestClient:
     """HTTP client for load testing."""
     
-    def __init__(self, base_url: str = "http://testserver"):
+    def __init__(self, base_url: str = "http://testserver", max_connections: int = 200):
         self.base_url = base_url
+        # Keep every pooled connection alive between requests, so users above
+        # the keep-alive cap do not queue behind fresh connects
         self.session = httpx.AsyncClient(
             base_url=base_url,
             timeout=30.0,
-            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60.0
+            )
         )
     
     async def close(self):
@@ -247,7 +262,7 @@ class LoadTestClient:
                 timestamp=timestamp,
                 user_id=0,  # Will be set by caller
                 request_size=len(kwargs.get('json', {})) if 'json' in kwargs else 0,
-                response_size=len(response.content) if hasattr(response, 'content') else 0
+                response_size=len(response.content)
             )
             
         except Exception as e:
@@ -284,16 +299,14 @@ class LoadTestRunner:
         
         self.results.start_time = time.time()
         
-        # Create clients
-        clients = []
-        for i in range(self.config.concurrent_users):
-            client = LoadTestClient()
-            clients.append(client)
+        # One client for all users; each user has at most one request in
+        # flight, so a pool of one connection per user never queues
+        client = LoadTestClient(max_connections=max(200, self.config.concurrent_users))
         
         try:
             # Create user tasks with ramp-up
             tasks = []
-            for i, client in enumerate(clients):
+            for i in range(self.config.concurrent_users):
                 # Stagger user start times for ramp-up
                 delay = (i / self.config.concurrent_users) * self.config.ramp_up_seconds
                 task = asyncio.create_task(self._simulate_user(client, i, delay))
@@ -303,9 +316,7 @@ class LoadTestRunner:
             await asyncio.gather(*tasks, return_exceptions=True)
             
         finally:
-            # Clean up clients
-            for client in clients:
-                await client.close()
+            await client.close()
         
         self.results.end_time = time.time()
         
@@ -632,6 +643,29 @@ class ScalabilityTestSuite:
         logger.info(f"  Status codes: {summary['status_codes']}")
 
 
+def test_load_test_summary_percentiles():
+    """Test that summary percentiles use the nearest-rank index over successful requests."""
+    config = LoadTestConfig(concurrent_users=1, test_duration_seconds=1, ramp_up_seconds=0,
+                            endpoints=["/fast", "/slow"])
+    requests = [
+        RequestResult(endpoint="/fast" if i % 2 else "/slow", method="GET", status_code=200,
+                      response_time=float(i), success=True, error=None, timestamp=float(i), user_id=0)
+        for i in range(100, 0, -1)
+    ]
+    requests.append(RequestResult(endpoint="/slow", method="GET", status_code=500, response_time=500.0,
+                                  success=False, error="HTTP 500", timestamp=0.0, user_id=0))
+    results = LoadTestResults(config=config, requests=requests, start_time=0, end_time=100)
+    
+    summary = results.get_summary()
+    assert summary['response_times']['min'] == 1.0
+    assert summary['response_times']['max'] == 100.0
+    assert summary['response_times']['p95'] == results.get_percentile(95) == 96.0
+    assert summary['response_times']['p99'] == 100.0
+    assert summary['endpoint_stats']['/fast']['p95_response_time'] == 95.0
+    assert summary['endpoint_stats']['/slow']['total_requests'] == 51
+    assert summary['endpoint_stats']['/slow']['successful_requests'] == 50
+
+
 # Standalone load test runner
 async def run_custom_load_test(
     concurrent_users: int = 50,